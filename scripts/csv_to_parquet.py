@@ -1,23 +1,41 @@
-import pandas as pd
 import os
+import sys
+import warnings
+import pyarrow as pa
+from pyarrow import csv as pacsv, parquet as pq
 
-def csv_to_parquet(path_csv, path_final="../data"):
+sys.path.append(os.path.abspath("../"))
+
+from scripts.time_series_preprocessing import PARQUET_WRITE_OPTIONS
+
+def _warn_bad_line(row):
+    warnings.warn(f"Linha ignorada: {row.text}")
+    return 'skip'
+
+def csv_to_parquet(path_csv, path_final="../data", dtype_map=None):
     """
     Converte um arquivo CSV para o formato Parquet e o salva no diretório especificado.
-    
+
     :param path_csv: Caminho do arquivo CSV de entrada.
     :param path_final: Diretório onde o arquivo Parquet será salvo (padrão: "../data").
-    :return: Nenhum retorno explícito, mas salva o arquivo convertido no local indicado.
+    :param dtype_map: Tipos Arrow por coluna aplicados antes da escrita (ex: {'y': pa.float32()}).
+    :return: Tabela Arrow escrita, para ser reutilizada sem reler o Parquet.
     """
-    df = pd.read_csv(path_csv, sep=';', on_bad_lines='warn')
+    table = pacsv.read_csv(
+        path_csv,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 24),
+        parse_options=pacsv.ParseOptions(delimiter=';', invalid_row_handler=_warn_bad_line)
+    )
+    if dtype_map:
+        table = table.cast(pa.schema([pa.field(f.name, dtype_map.get(f.name, f.type)) for f in table.schema]))
 
-    if not os.path.exists(path_final):
-        os.makedirs(path_final)
+    os.makedirs(path_final, exist_ok=True)
 
     path_arquivo_parquet = os.path.join(path_final, os.path.splitext(os.path.basename(path_csv))[0] + ".parquet")
-    
-    df.to_parquet(path_arquivo_parquet, engine="pyarrow")
+
+    pq.write_table(table, path_arquivo_parquet, **PARQUET_WRITE_OPTIONS)
     print(f'Arquivo salvo em: {path_arquivo_parquet}')
+    return table
 
 
-csv_to_parquet("../data/Dados_commodities_mensal_nova.csv")
\ No newline at end of file
+csv_to_parquet("../data/Dados_commodities_mensal_nova.csv")
@@ -1,12 +1,76 @@
-import pandas as pd
-from sklearn.metrics import mean_absolute_error, mean_absolute_percentage_error , mean_squared_error, root_mean_squared_error, r2_score
+import math
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba é opcional; sem ele usamos o caminho NumPy
+    numba = None
+
+_EPS = np.finfo(np.float64).eps
+
+# A partir deste tamanho o kernel compilado compensa o overhead de despacho
+NUMBA_MIN_SIZE = 100_000
+
+
+def _error_sums_numpy(yt, yp, yt_mean):
+    diff = yt - yp
+    abs_diff = np.abs(diff)
+    sq_diff = diff * diff
+    # mesmo epsilon do sklearn para evitar divisão por zero
+    sape = (abs_diff / np.maximum(np.abs(yt), _EPS)).sum()
+    sst = ((yt - yt_mean) ** 2).sum()
+    return abs_diff.sum(), sape, sq_diff.sum(), sst
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _error_sums_numba(yt, yp, yt_mean):
+        sad = 0.0
+        sape = 0.0
+        ssq = 0.0
+        sst = 0.0
+        for i in numba.prange(yt.shape[0]):
+            d = yt[i] - yp[i]
+            ad = abs(d)
+            sad += ad
+            sape += ad / max(abs(yt[i]), _EPS)
+            ssq += d * d
+            c = yt[i] - yt_mean
+            sst += c * c
+        return sad, sape, ssq, sst
+
+
+def _r2_from_sums(ssq, sst, n):
+    # regras do r2_score: menos de 2 pontos dá NaN; SST nulo dá 1.0 (ajuste perfeito) ou 0.0
+    if n < 2:
+        return float('nan')
+    if sst == 0:
+        return 1.0 if ssq == 0 else 0.0
+    return 1.0 - ssq / sst
+
 
 def evaluate_forecasts(y_true, y_pred):
-    mae = mean_absolute_error(y_true, y_pred)
-    mape = mean_absolute_percentage_error(y_true, y_pred)
-    mse = mean_squared_error(y_true, y_pred)
-    rmse = root_mean_squared_error(y_true, y_pred)
-    r2 = r2_score(y_true, y_pred)
+    yt = np.ascontiguousarray(y_true, dtype=np.float64)
+    yp = np.ascontiguousarray(y_pred, dtype=np.float64)
+    n = yt.shape[0]
+    # mesmas validações do sklearn: entradas vazias ou de tamanhos diferentes são erro
+    if n == 0:
+        raise ValueError("y_true e y_pred não podem ser vazios")
+    if yp.shape[0] != n:
+        raise ValueError(f"y_true e y_pred com tamanhos diferentes: {n} e {yp.shape[0]}")
+    yt_mean = yt.mean()
+
+    # uma única passada reaproveitada por todas as métricas
+    if numba is not None and n >= NUMBA_MIN_SIZE:
+        sad, sape, ssq, sst = _error_sums_numba(yt, yp, yt_mean)
+    else:
+        sad, sape, ssq, sst = _error_sums_numpy(yt, yp, yt_mean)
+
+    mae = sad / n
+    mape = sape / n
+    mse = ssq / n
+    rmse = math.sqrt(mse)
+    r2 = _r2_from_sums(ssq, sst, n)
 
     return {
         'MAE': mae,
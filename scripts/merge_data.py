@@ -1,34 +1,155 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append(os.path.abspath("../"))
 
-from scripts.time_series_preprocessing import export_to_parquet
+from scripts.time_series_preprocessing import PARQUET_WRITE_OPTIONS
 
-def merge_parquet_dfs(dfs):
-    if not dfs:
-        raise ValueError("A lista de DataFrames está vazia.")
-    
-    df_merged = pd.concat(dfs, axis=0, ignore_index=True)
-    return df_merged
+# Projeção de colunas na leitura: os parquets por commodity também guardam
+# __index_level_0__, que assim nem é lido/descomprimido nem entra no merge.
+MERGE_COLUMNS = ['ds', 'y', 'unique_id']
 
-df_acucar_santos_brl = pd.read_parquet('../data/acucar/acucar_santos_brl.parquet')
-df_acucar_sp_brl = pd.read_parquet('../data/acucar/acucar_sp_brl.parquet')
-df_algodao_brl = pd.read_parquet('../data/algodao/algodao_brl.parquet')
-df_arroz_brl = pd.read_parquet('../data/arroz/arroz_brl.parquet')
-df_cafe_arabica_brl = pd.read_parquet('../data/cafe/cafe_arabica_brl.parquet')
-df_cafe_robusta_brl = pd.read_parquet('../data/cafe/cafe_robusta_brl.parquet')
-df_milho_brl = pd.read_parquet('../data/milho/milho_brl.parquet')
-df_soja_parana_brl = pd.read_parquet('../data/soja/soja_parana_brl.parquet')
-df_soja_paranagua_brl = pd.read_parquet('../data/soja/soja_paranagua_brl.parquet')
-df_trigo_parana_brl = pd.read_parquet('../data/trigo/trigo_parana_brl.parquet')
-df_trigo_rs_brl = pd.read_parquet('../data/trigo/trigo_rs_brl.parquet')
+def merge_tables(tables):
+    """
+    Concatena tabelas Arrow sem passar pelo BlockManager do pandas.
 
+    Parâmetros:
+    -----------
+    tables : list[pa.Table]
+        Tabelas lidas com `pq.read_table`, com colunas compatíveis.
 
-dfs_brl = [df_acucar_santos_brl, df_acucar_sp_brl, df_algodao_brl, df_arroz_brl, df_cafe_arabica_brl, df_cafe_robusta_brl, df_milho_brl,
-           df_soja_parana_brl, df_soja_paranagua_brl, df_trigo_parana_brl, df_trigo_rs_brl]
+    Retorna:
+    --------
+    pa.Table
+        Tabela única com as linhas de todas as tabelas, na ordem recebida.
+    """
+    if not tables:
+        raise ValueError("A lista de tabelas está vazia.")
 
-df_brl_final = merge_parquet_dfs(dfs_brl)
+    return pa.concat_tables(tables, promote_options="default")
 
-export_to_parquet(df_brl_final, "../data/all_comm/all_commodities_brl.parquet")
\ No newline at end of file
+
+# Nome antigo, mantido para compatibilidade
+merge_parquet_dfs = merge_tables
+
+
+def sort_by_series(table):
+    """
+    Ordena a tabela por ('unique_id', 'ds') e junta os chunks em buffers contíguos.
+
+    Parâmetros:
+    -----------
+    table : pa.Table
+        Tabela com colunas 'unique_id' e 'ds'.
+
+    Retorna:
+    --------
+    pa.Table
+        Tabela ordenada, com um único chunk por coluna.
+    """
+    sort_idx = pc.sort_indices(table, sort_keys=[('unique_id', 'ascending'), ('ds', 'ascending')])
+    return table.take(sort_idx).combine_chunks()
+
+
+def export_by_series(table, path_parquet, **write_options):
+    """
+    Salva uma tabela ordenada por série com um row group por 'unique_id'.
+
+    Com um row group por commodity, leituras com `filters=[('unique_id', '=', ...)]`
+    pulam os demais grupos usando as estatísticas do footer.
+
+    Parâmetros:
+    -----------
+    table : pa.Table
+        Tabela já ordenada por ('unique_id', 'ds') (ver `sort_by_series`).
+
+    path_parquet : str
+        Caminho completo para salvar o arquivo .parquet.
+
+    **write_options
+        Sobrescrevem PARQUET_WRITE_OPTIONS (row_group_size é ignorado).
+    """
+    os.makedirs(os.path.dirname(path_parquet) or '.', exist_ok=True)
+
+    options = {**PARQUET_WRITE_OPTIONS, **write_options}
+    options.pop('row_group_size', None)
+
+    # tabela ordenada: a ordem de primeira ocorrência já é a ordem das séries
+    counts = pc.value_counts(table['unique_id'])
+    with pq.ParquetWriter(path_parquet, table.schema, **options) as writer:
+        offset = 0
+        for count in counts.field('counts').to_pylist():
+            writer.write_table(table.slice(offset, count), row_group_size=count)
+            offset += count
+    print(f'Arquivo salvo em: {path_parquet}')
+
+
+def to_pandas_zero_copy(table):
+    """
+    Converte uma tabela Arrow para DataFrame mantendo as colunas apoiadas nos buffers Arrow.
+
+    Parâmetros:
+    -----------
+    table : pa.Table
+        Tabela a ser convertida. Não deve ser reutilizada após a chamada (self_destruct).
+
+    Retorna:
+    --------
+    pd.DataFrame
+        DataFrame com dtypes `pd.ArrowDtype`.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+
+
+def read_parquet_tables(paths, columns=MERGE_COLUMNS):
+    """
+    Lê vários arquivos Parquet em paralelo, sobrepondo I/O e descompressão.
+
+    Parâmetros:
+    -----------
+    paths : list[str]
+        Caminhos dos arquivos .parquet.
+
+    columns : list[str]
+        Colunas a serem lidas de cada arquivo.
+
+    Retorna:
+    --------
+    list[pa.Table]
+        Tabelas na mesma ordem de `paths`.
+    """
+    # pq.read_table já usa threads internas por row group; limitar evita oversubscription
+    max_workers = max(1, min(len(paths), (os.cpu_count() or 2) // 2))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: pq.read_table(path, columns=columns, use_threads=True), paths))
+
+
+def main():
+    paths_brl = [
+        '../data/acucar/acucar_santos_brl.parquet',
+        '../data/acucar/acucar_sp_brl.parquet',
+        '../data/algodao/algodao_brl.parquet',
+        '../data/arroz/arroz_brl.parquet',
+        '../data/cafe/cafe_arabica_brl.parquet',
+        '../data/cafe/cafe_robusta_brl.parquet',
+        '../data/milho/milho_brl.parquet',
+        '../data/soja/soja_parana_brl.parquet',
+        '../data/soja/soja_paranagua_brl.parquet',
+        '../data/trigo/trigo_parana_brl.parquet',
+        '../data/trigo/trigo_rs_brl.parquet',
+    ]
+
+    # tabelas ficam locais: os buffers Arrow são liberados ao sair de main()
+    tables_brl = read_parquet_tables(paths_brl)
+    table_brl_final = sort_by_series(merge_tables(tables_brl))
+
+    export_by_series(table_brl_final, "../data/all_comm/all_commodities_brl.parquet")
+
+
+if __name__ == '__main__':
+    main()
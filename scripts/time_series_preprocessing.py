@@ -1,5 +1,22 @@
 import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Opções de escrita Parquet de todo o projeto: scripts de conversão e o cache dos
+# loaders (ParquetExporter) usam este mesmo dicionário, então todos os arquivos têm
+# o mesmo layout de row groups
+PARQUET_WRITE_OPTIONS = {
+    'compression': 'zstd',
+    'compression_level': 3,
+    'row_group_size': 100_000,
+    'use_dictionary': True,
+    'write_statistics': True,
+    'data_page_size': 1 << 20,
+}
+
 
 def split_currency_data(df):
     """
@@ -15,8 +32,9 @@ def split_currency_data(df):
     tuple
         Dois DataFrames: um com os dados em reais e outro em dólares.
     """
-    df_brl = df[['Data', 'À vista R$']].copy()
-    df_usd = df[['Data', 'À vista US$']].copy()
+    # seleção por lista já devolve um novo DataFrame; .copy() faria uma segunda cópia
+    df_brl = df[['Data', 'À vista R$']]
+    df_usd = df[['Data', 'À vista US$']]
     return df_brl, df_usd
 
 
@@ -43,18 +61,18 @@ def extract_currency_series(df, currency="BRL"):
         Se o tipo de moeda fornecido for inválido.
     """
     if currency == "BRL":
-        return df[['Data', 'À vista R$']].copy()
+        return df[['Data', 'À vista R$']]
     elif currency == "USD":
-        return df[['Data', 'À vista US$']].copy()
+        return df[['Data', 'À vista US$']]
     else:
         raise AttributeError("Invalid currency type")
     
 
 def extract_currency_series_algodao(df, currency="BRL"):
     if currency == "BRL":
-        return df[['Data', 'Prazo de 8 dias R$']].copy()
+        return df[['Data', 'Prazo de 8 dias R$']]
     elif currency == "USD":
-        return df[['Data', 'Prazo de 8 dias US$']].copy()
+        return df[['Data', 'Prazo de 8 dias US$']]
     else:
         raise AttributeError("Invalid currency type")
 
@@ -77,14 +95,16 @@ def rename_columns_and_set_id(df, cols_dict, unique_id):
     Retorna:
     --------
     pd.DataFrame
-        DataFrame com colunas renomeadas e nova coluna 'unique_id'.
+        DataFrame com colunas renomeadas e nova coluna 'unique_id' (categórica).
     """
-    df = df.rename(columns=cols_dict, inplace=False)
-    df['unique_id'] = unique_id
+    df = df.copy(deep=False)
+    df.rename(columns=cols_dict, inplace=True)
+    # um único valor: códigos int8 em vez de N ponteiros para a mesma string
+    df['unique_id'] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), categories=[unique_id])
     return df
 
 
-def convert_column_to_datetime(df, column):
+def convert_column_to_datetime(df, column, inplace=False):
     """
     Converte a coluna alvo (column) de strings para objetos datetime.
 
@@ -96,17 +116,24 @@ def convert_column_to_datetime(df, column):
     column : str
         Coluna alvo do dataframe que precisa e será convertida.
 
+    inplace : bool
+        Se True, altera `df` diretamente em vez de trabalhar sobre uma cópia.
+
     Retorna:
     --------
     pd.DataFrame
         DataFrame com a coluna convertida para datetime.
     """
-    df = df.copy()
-    df[column] = pd.to_datetime(df[column], format='%d/%m/%Y', errors='coerce')
+    if not inplace:
+        df = df.copy()
+    # datas se repetem muito: converte apenas os valores únicos e expande pelos códigos
+    codes, uniques = pd.factorize(df[column])
+    parsed = pd.to_datetime(uniques, format='%d/%m/%Y', errors='coerce')
+    df[column] = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
     return df
 
 
-def convert_column_to_float(df, column):
+def convert_column_to_float(df, column, dtype=np.float64, inplace=False):
     """
     Converte a coluna alvo (column) de string para float, tratando vírgulas como separadores decimais.
 
@@ -118,18 +145,79 @@ def convert_column_to_float(df, column):
     column : str
         Coluna alvo do dataframe que precisa e será convertida.
 
+    dtype : np.dtype
+        Tipo float de saída. np.float32 basta para preços (≤ 6 dígitos significativos)
+        e reduz a memória pela metade.
+
+    inplace : bool
+        Se True, altera `df` diretamente em vez de trabalhar sobre uma cópia.
+
     Retorna:
     --------
     pd.DataFrame
         DataFrame com a coluna alvo convertida para tipo float.
     """
-    df = df.copy()
-    df[column] = df[column].astype(str).str.replace(',', '.', regex=False)
-    df[column] = df[column].astype(float)
+    if not inplace:
+        df = df.copy()
+    if pd.api.types.is_numeric_dtype(df[column]):
+        df[column] = df[column].astype(dtype)
+        return df
+
+    # replace + cast em kernels do Arrow: uma única passada sobre o buffer de strings
+    arr = pa.array(df[column], from_pandas=True, type=pa.string())
+    arr = pc.replace_substring(arr, pattern=',', replacement='.')
+    df[column] = pc.cast(arr, pa.from_numpy_dtype(np.dtype(dtype))).to_numpy(zero_copy_only=False)
     
     return df
 
 
+def preprocess_series(df, cols_dict, unique_id, currency="BRL", algodao=False, limit_date=None, dtype=np.float64):
+    """
+    Executa extração → renomeação → datas → float (→ data limite) com uma única cópia.
+
+    A seleção de colunas da moeda já produz um DataFrame novo; as etapas seguintes
+    trabalham sobre ele in-place em vez de copiar o frame inteiro a cada passo.
+
+    Parâmetros:
+    -----------
+    df : pd.DataFrame
+        DataFrame bruto lido do CSV do CEPEA.
+
+    cols_dict : dict
+        Mapeamento para 'ds' e 'y'. Exemplo: {'Data': 'ds', 'À vista R$': 'y'}
+
+    unique_id : str
+        Identificador da série.
+
+    currency : str
+        Moeda a ser extraída: 'BRL' ou 'USD'.
+
+    algodao : bool
+        Se True, usa as colunas de prazo de 8 dias do indicador do algodão.
+
+    limit_date : str, opcional
+        Data limite no formato '%d/%m/%Y'; linhas a partir dela são removidas.
+
+    dtype : np.dtype
+        Tipo float da coluna 'y'.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        DataFrame com colunas 'ds', 'y' e 'unique_id'.
+    """
+    extract = extract_currency_series_algodao if algodao else extract_currency_series
+    df = extract(df, currency)
+    df = rename_columns_and_set_id(df, cols_dict, unique_id)
+    convert_column_to_datetime(df, 'ds', inplace=True)
+    convert_column_to_float(df, 'y', dtype=dtype, inplace=True)
+
+    if limit_date is not None:
+        df = drop_over_limit_date(df, limit_date, 'ds')
+
+    return df
+
+
 def aggregate_monthly_mean(df):
     """
     Agrega a série temporal calculando a média mensal por identificador único.
@@ -144,13 +232,23 @@ def aggregate_monthly_mean(df):
     pd.DataFrame
         DataFrame com a média mensal por 'unique_id' no formato adequado para modelagem temporal.
     """
-    df = df.copy()
-    df['ds'] = pd.to_datetime(df['ds'])
-    df['year_month'] = df['ds'].dt.to_period('M')
-
-    df_monthly = df.groupby(['year_month', 'unique_id']).agg({'y': 'mean'}).reset_index()
-    df_monthly['ds'] = pd.to_datetime(df_monthly['year_month'].astype(str) + '-01')
-    df_monthly = df_monthly[['ds', 'y', 'unique_id']]
+    # truncar para mês no numpy evita a coluna de Period e a volta por string
+    year_month = pd.to_datetime(df['ds'], cache=True).to_numpy().astype('datetime64[M]').astype('datetime64[ns]')
+
+    table = pa.table({
+        'ds': pa.array(year_month),
+        'y': pa.array(df['y'], from_pandas=True),
+        'unique_id': pa.array(df['unique_id'], from_pandas=True),
+    })
+    table = table.group_by(['ds', 'unique_id']).aggregate([('y', 'mean')])
+
+    df_monthly = pd.DataFrame({
+        'ds': table['ds'].to_pandas(),
+        'y': table['y_mean'].to_numpy(),
+        'unique_id': table['unique_id'].to_pandas(),
+    })
+    # ordenação sobre o resultado agregado (pequeno); aceita unique_id categórico
+    df_monthly = df_monthly.sort_values(['ds', 'unique_id']).reset_index(drop=True)
     
     return df_monthly
 
@@ -181,26 +279,37 @@ def drop_over_limit_date(df, limit_date, column_date):
     return df
 
 
-def export_to_parquet(df, path_parquet):
+def export_to_parquet(df, path_parquet, dtype_map=None, **write_options):
     """
-    Salva um DataFrame em formato Parquet no caminho especificado.
+    Salva um DataFrame (ou tabela Arrow) em formato Parquet no caminho especificado.
 
     Parâmetros:
     -----------
-    df : pd.DataFrame
-        DataFrame a ser salvo.
+    df : pd.DataFrame ou pa.Table
+        Dados a serem salvos. Tabelas Arrow são escritas sem conversão.
 
     path_parquet : str
         Caminho completo para salvar o arquivo .parquet.
 
+    dtype_map : dict, opcional
+        Tipos Arrow por coluna aplicados antes da escrita. Exemplo: {'y': pa.float32()}
+
+    **write_options
+        Sobrescrevem PARQUET_WRITE_OPTIONS (ex: row_group_size menor para tabelas pequenas).
+
     Retorna:
     --------
-    None
-        Salva o arquivo e imprime uma mensagem de sucesso.
+    pa.Table
+        Tabela efetivamente escrita, para encadear etapas sem reler o arquivo.
     """
-    dir_final = os.path.dirname(path_parquet)
-    if not os.path.exists(dir_final):
-        os.makedirs(dir_final)
-
-    df.to_parquet(path_parquet, engine="pyarrow")
+    os.makedirs(os.path.dirname(path_parquet) or '.', exist_ok=True)
+
+    table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+    if dtype_map:
+        table = table.cast(pa.schema(
+            [pa.field(f.name, dtype_map.get(f.name, f.type)) for f in table.schema],
+            metadata=table.schema.metadata
+        ))
+    pq.write_table(table, path_parquet, **{**PARQUET_WRITE_OPTIONS, **write_options})
     print(f'Arquivo salvo em: {path_parquet}')
+    return table
@@ -1,9 +1,76 @@
+import os
+import numpy as np
 import pandas as pd
+import matplotlib
+
+# Execução em lote (relatórios, export de notebooks): SMP_HEADLESS_PLOTS=1 usa o backend Agg
+if os.environ.get('SMP_HEADLESS_PLOTS'):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
 from statsmodels.tsa.stattools import adfuller
 
+def downsample_lttb(x, y, n_out=2000):
+    """
+    Reduz uma série para no máximo `n_out` pontos com Largest-Triangle-Three-Buckets (LTTB).
+
+    Mantém o primeiro e o último ponto e, em cada bucket, o ponto que forma o maior
+    triângulo com o ponto escolhido no bucket anterior e a média do próximo, preservando
+    picos e vales visíveis no gráfico.
+
+    Parâmetros:
+    -----------
+    x : pd.Series
+        Valores do eixo x (datas, com ou sem fuso, ou números), em ordem crescente.
+
+    y : pd.Series
+        Valores do eixo y. Pontos com y ausente (NaN) são descartados antes da redução.
+
+    n_out : int
+        Número máximo de pontos retornados.
+
+    Retorna:
+    --------
+    tuple
+        Séries (x, y) reduzidas, mantendo os índices originais.
+    """
+    if len(x) <= n_out or n_out < 3:
+        return x, y
+
+    # NaN em y contaminaria as médias dos buckets e seria escolhido pelo argmax
+    valid = y.notna().to_numpy()
+    if not valid.all():
+        x, y = x[valid], y[valid]
+    n = len(x)
+    if n <= n_out:
+        return x, y
+
+    if pd.api.types.is_datetime64_any_dtype(x):
+        # datas com fuso viram array object em to_numpy(); pedir datetime64[ns] converte para UTC
+        xs = x.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    else:
+        xs = x.to_numpy()
+    xs = xs.astype(np.float64)
+    ys = y.to_numpy(dtype=np.float64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = xs[end:next_end].mean()
+        avg_y = ys[end:next_end].mean()
+        area = np.abs((xs[a] - avg_x) * (ys[start:end] - ys[a]) - (xs[a] - xs[start:end]) * (avg_y - ys[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return x.iloc[idx], y.iloc[idx]
+
+
 def plot_raw_series(df, value_column):
     """
     Plota uma série temporal com base em um DataFrame e uma coluna de valores especificada.
@@ -22,17 +89,19 @@ def plot_raw_series(df, value_column):
 
     Retorna:
     --------
-    None
-        A função apenas exibe o gráfico e não retorna nenhum valor.
+    matplotlib.figure.Figure
+        Figura gerada; o chamador decide entre plt.show() e fig.savefig().
     """
-    plt.figure(figsize=(12, 6))
-    plt.plot(df['ds'], df[value_column], linestyle='-')
+    fig = plt.figure(figsize=(12, 6))
+    # ~2000 pontos bastam para a largura da figura; o resto só custa tempo de render
+    xs, ys = downsample_lttb(df['ds'], df[value_column])
+    plt.plot(xs, ys, linestyle='-', rasterized=True)
     plt.xlabel('Data')
     plt.ylabel(value_column)
     plt.title(f'Série Temporal de {value_column}')
     plt.xticks(rotation=45)
     plt.grid()
-    plt.show()
+    return fig
 
 def plot_series_acf(series):
     """
@@ -45,13 +114,13 @@ def plot_series_acf(series):
 
     Retorna:
     --------
-    None
-        Apenas exibe o gráfico.
+    matplotlib.figure.Figure
+        Figura gerada; o chamador decide entre plt.show() e fig.savefig().
     """
     fig, ax = plt.subplots(figsize=(12, 6))
     plot_acf(series, lags=100, ax=ax)
     ax.set_title("ACF da Série Temporal")
-    plt.show()
+    return fig
 
 def plot_series_pacf(series):
     """
@@ -64,13 +133,13 @@ def plot_series_pacf(series):
 
     Retorna:
     --------
-    None
-        Apenas exibe o gráfico.
+    matplotlib.figure.Figure
+        Figura gerada; o chamador decide entre plt.show() e fig.savefig().
     """
     fig, ax = plt.subplots(figsize=(12, 6))
     plot_pacf(series, lags=100, ax=ax)
     ax.set_title("PACF da Série Temporal")
-    plt.show()
+    return fig
 
 def checks_stationarity(series):
     """
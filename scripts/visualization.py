@@ -1,18 +1,46 @@
+import os
 import pandas as pd
+import matplotlib
+
+# Execução em lote (relatórios, export de notebooks): SMP_HEADLESS_PLOTS=1 usa o backend Agg
+if os.environ.get('SMP_HEADLESS_PLOTS'):
+    matplotlib.use('Agg')
+
+import numpy as np
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import seaborn as sns
 from typing import List, Dict, Optional
 
+def _group_by_commodity(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Particiona o DataFrame por 'unique_id' em uma única passada."""
+    return {cid: group for cid, group in df.groupby('unique_id', sort=False, observed=True)}
+
+
+# Cópia de ForecastVisualizer._to_plot_x: scripts/ não importa de src/, mantenha as duas iguais
+def _to_plot_x(ds: pd.Series) -> np.ndarray:
+    """Converte o eixo x para os números que o matplotlib usa internamente."""
+    if pd.api.types.is_datetime64_any_dtype(ds):
+        return mdates.date2num(ds.to_numpy())
+    return ds.to_numpy(dtype=float)
+
+
 def plot_metrics_comparison(
     metrics_df: pd.DataFrame,
     metrics: List[str] = ['MAE', 'MAPE', 'MSE', 'RMSE', 'R2']
-) -> None:
+) -> Figure:
     """
     Plota comparação de métricas entre modelos.
     
     Args:
         metrics_df: DataFrame com métricas calculadas
         metrics: Lista de métricas a serem plotadas
+
+    Returns:
+        Figura do matplotlib; o chamador decide entre plt.show() e fig.savefig()
     """
     fig, axes = plt.subplots(3, 2, figsize=(15, 10))
     
@@ -31,7 +59,7 @@ def plot_metrics_comparison(
     fig.delaxes(axes[2, 1])
     
     plt.tight_layout()
-    plt.show()
+    return fig
 
 
 def plot_forecasts_grid(
@@ -40,7 +68,7 @@ def plot_forecasts_grid(
     models: List[str],
     commodities: List[str],
     n_cols: int = 2
-) -> None:
+) -> Figure:
     """
     Plota grid de previsões para múltiplas commodities.
     
@@ -50,37 +78,53 @@ def plot_forecasts_grid(
         models: Lista de nomes dos modelos
         commodities: Lista de commodities
         n_cols: Número de colunas no grid
+
+    Returns:
+        Figura do matplotlib; o chamador decide entre plt.show() e fig.savefig()
     """
     n_rows = (len(commodities) + n_cols - 1) // n_cols
     fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 5*n_rows))
     
+    actual_by = _group_by_commodity(actual)
+    forecasts_by = _group_by_commodity(forecasts)
+    
+    # cor fixa por modelo, seguindo o ciclo de cores padrão
+    color_cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    model_colors = [color_cycle[i % len(color_cycle)] for i in range(len(models))]
+    
     for idx, commodity in enumerate(commodities):
         row = idx // n_cols
         col = idx % n_cols
         ax = axes[row, col] if n_rows > 1 else axes[col]
         
-        ax.plot(
-            actual[actual['unique_id'] == commodity]['ds'],
-            actual[actual['unique_id'] == commodity]['y'],
+        actual_commodity = actual_by.get(commodity, actual.iloc[0:0])
+        actual_line, = ax.plot(
+            actual_commodity['ds'],
+            actual_commodity['y'],
             label='Valor Real',
-            color='black'
+            color='black',
+            rasterized=True
         )
         
-        for model in models:
-            ax.plot(
-                forecasts[forecasts['unique_id'] == commodity]['ds'],
-                forecasts[forecasts['unique_id'] == commodity][model],
-                label=model
-            )
+        # todas as linhas dos modelos em um único artist
+        forecast_commodity = forecasts_by.get(commodity, forecasts.iloc[0:0])
+        x = _to_plot_x(forecast_commodity['ds'])
+        ax.add_collection(LineCollection(
+            [np.column_stack([x, forecast_commodity[model].to_numpy(dtype=float)]) for model in models],
+            colors=model_colors,
+            rasterized=True
+        ))
+        ax.autoscale_view()
         
         ax.set_title(commodity)
         ax.grid(True)
         ax.tick_params(axis='x', rotation=45)
     
     plt.tight_layout()
-    handles, labels = ax.get_legend_handles_labels()
-    fig.legend(handles, labels, loc='lower center', ncol=len(models)+1)
-    plt.show()
+    # a LineCollection não tem label por linha: legenda com proxies dos modelos
+    handles = [actual_line] + [Line2D([], [], color=c, label=m) for m, c in zip(models, model_colors)]
+    fig.legend(handles, [h.get_label() for h in handles], loc='lower center', ncol=len(models)+1)
+    return fig
 
 
 def plot_validation_forecasts(
@@ -89,7 +133,7 @@ def plot_validation_forecasts(
     forecasts_val: pd.DataFrame,
     commodity: str,
     models: List[str] = ['Naive', 'AutoARIMA']
-) -> None:
+) -> Figure:
     """
     Plota previsões de validação vs valores reais para uma commodity.
     
@@ -99,30 +143,41 @@ def plot_validation_forecasts(
         forecasts_val: DataFrame com previsões de validação
         commodity: Nome da commodity
         models: Lista de modelos a serem plotados
+
+    Returns:
+        Figura do matplotlib; o chamador decide entre plt.show() e fig.savefig()
     """
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
+    
+    # cada DataFrame é filtrado uma única vez
+    train_data_commodity = train_data[train_data['unique_id'] == commodity]
+    val_data_commodity = val_data[val_data['unique_id'] == commodity]
+    forecasts_val_commodity = forecasts_val[forecasts_val['unique_id'] == commodity]
     
     plt.plot(
-        train_data[train_data['unique_id'] == commodity]['ds'],
-        train_data[train_data['unique_id'] == commodity]['y'],
+        train_data_commodity['ds'],
+        train_data_commodity['y'],
         label=f'Real {commodity} (Treino)',
         linestyle='--',
-        color='gray'
+        color='gray',
+        rasterized=True
     )
     
     plt.plot(
-        val_data[val_data['unique_id'] == commodity]['ds'],
-        val_data[val_data['unique_id'] == commodity]['y'],
+        val_data_commodity['ds'],
+        val_data_commodity['y'],
         label=f'Real {commodity} (Validação)',
         linestyle='--',
-        color='black'
+        color='black',
+        rasterized=True
     )
     
     for model in models:
         plt.plot(
-            forecasts_val[forecasts_val['unique_id'] == commodity]['ds'],
-            forecasts_val[forecasts_val['unique_id'] == commodity][model],
-            label=f'Previsão {model}'
+            forecasts_val_commodity['ds'],
+            forecasts_val_commodity[model],
+            label=f'Previsão {model}',
+            rasterized=True
         )
     
     plt.legend()
@@ -130,7 +185,7 @@ def plot_validation_forecasts(
     plt.grid(True)
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.show()
+    return fig
 
 def plot_test_forecasts(
     full_train: pd.DataFrame,
@@ -138,7 +193,7 @@ def plot_test_forecasts(
     forecasts_test: pd.DataFrame,
     commodity: str,
     models: List[str] = ['Naive', 'AutoARIMA']
-) -> None:
+) -> Figure:
     """
     Plota previsões de teste vs valores reais para uma commodity.
     
@@ -148,30 +203,41 @@ def plot_test_forecasts(
         forecasts_test: DataFrame com previsões de teste
         commodity: Nome da commodity
         models: Lista de modelos a serem plotados
+
+    Returns:
+        Figura do matplotlib; o chamador decide entre plt.show() e fig.savefig()
     """
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
+    
+    # cada DataFrame é filtrado uma única vez
+    full_train_commodity = full_train[full_train['unique_id'] == commodity]
+    test_data_commodity = test_data[test_data['unique_id'] == commodity]
+    forecasts_test_commodity = forecasts_test[forecasts_test['unique_id'] == commodity]
     
     plt.plot(
-        full_train[full_train['unique_id'] == commodity]['ds'],
-        full_train[full_train['unique_id'] == commodity]['y'],
+        full_train_commodity['ds'],
+        full_train_commodity['y'],
         label=f'Real {commodity} (Treino + Validação)',
         linestyle='--',
-        color='gray'
+        color='gray',
+        rasterized=True
     )
     
     plt.plot(
-        test_data[test_data['unique_id'] == commodity]['ds'],
-        test_data[test_data['unique_id'] == commodity]['y'],
+        test_data_commodity['ds'],
+        test_data_commodity['y'],
         label=f'Real {commodity} (Teste)',
         linestyle='--',
-        color='black'
+        color='black',
+        rasterized=True
     )
     
     for model in models:
         plt.plot(
-            forecasts_test[forecasts_test['unique_id'] == commodity]['ds'],
-            forecasts_test[forecasts_test['unique_id'] == commodity][model],
-            label=f'Previsão {model}'
+            forecasts_test_commodity['ds'],
+            forecasts_test_commodity[model],
+            label=f'Previsão {model}',
+            rasterized=True
         )
     
     plt.legend()
@@ -179,4 +245,4 @@ def plot_test_forecasts(
     plt.grid(True)
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.show()
+    return fig
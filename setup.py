@@ -7,4 +7,7 @@ setup(
     author="Matt",
     packages=find_packages(),
     python_requires=">=3.10",
+    extras_require={
+        "polars": ["polars>=1.23"],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,119 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+try:
+    import numba
+except ImportError:  # numba é opcional; sem ele o FloatConverter usa pd.to_numeric
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+# 10**k é exato em float64 até k = 22
+_MAX_FRAC_DIGITS = 22
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _parse_decimal_comma(buf, offsets):
+        n = offsets.size - 1
+        out = np.empty(n, dtype=np.float64)
+        # True onde havia texto que não é número (vazio ou só espaços conta como ausente)
+        invalid = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            s = offsets[i]
+            e = offsets[i + 1]
+            # ignora espaços nas pontas
+            while s < e and buf[s] == 32:
+                s += 1
+            while e > s and buf[e - 1] == 32:
+                e -= 1
+            blank = s == e
+
+            negative = False
+            if s < e and (buf[s] == 45 or buf[s] == 43):  # '-' ou '+'
+                negative = buf[s] == 45
+                s += 1
+
+            mantissa = 0.0
+            frac_digits = 0
+            n_digits = 0
+            in_frac = False
+            valid = s < e
+            for k in range(s, e):
+                c = buf[k]
+                if c == 44 or c == 46:  # ',' ou '.'
+                    if in_frac:
+                        valid = False
+                        break
+                    in_frac = True
+                    continue
+                d = c - 48
+                if d < 0 or d > 9:
+                    valid = False
+                    break
+                mantissa = mantissa * 10.0 + d
+                n_digits += 1
+                if in_frac:
+                    frac_digits += 1
+
+            if not valid or n_digits == 0 or frac_digits > _MAX_FRAC_DIGITS:
+                out[i] = np.nan
+                invalid[i] = not blank
+                continue
+            # uma única divisão por potência exata de 10: mesmo arredondamento do float()
+            value = mantissa / 10.0 ** frac_digits
+            out[i] = -value if negative else value
+        return out, invalid
+
+
+def parse_decimal_comma(values) -> np.ndarray:
+    """
+    Converte strings com vírgula (ou ponto) decimal para float64 em uma única passada compilada.
+
+    Os bytes são lidos direto dos buffers Arrow da coluna. O kernel cobre sinal,
+    dígitos e um único separador decimal (',' ou '.'); o que ele recusa (ex: expoente)
+    é refeito com float() após trocar ',' por '.', como na conversão original. Nulos e
+    strings vazias viram NaN em silêncio; texto que nem o float() aceita (separador de
+    milhar como '1.234,56', caracteres soltos) também vira NaN, mas emite um
+    UserWarning com a contagem e exemplos.
+
+    Args:
+        values: Série/array de strings, ex: ['18,24', '5,98']
+
+    Returns:
+        Array float64 com os valores convertidos
+    """
+    arr = pa.array(values, type=pa.large_string(), from_pandas=True)
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+    buf = np.frombuffer(data_buf, dtype=np.uint8) if data_buf is not None else np.empty(0, dtype=np.uint8)
+
+    out, invalid = _parse_decimal_comma(buf, offsets)
+    if arr.null_count:
+        is_null = arr.is_null().to_numpy(zero_copy_only=False)
+        out[is_null] = np.nan
+        invalid &= ~is_null
+    if invalid.any():
+        # caminho lento só para os poucos valores fora da gramática do kernel
+        text = np.asarray(values, dtype=object)
+        for idx in np.flatnonzero(invalid):
+            try:
+                out[idx] = float(str(text[idx]).replace(',', '.'))
+                invalid[idx] = False
+            except ValueError:
+                pass
+        if invalid.any():
+            warn_unparsed(text[invalid])
+    return out
+
+
+def warn_unparsed(values) -> None:
+    """Avisa que valores não numéricos da fonte foram convertidos para NaN."""
+    examples = ', '.join(repr(v) for v in list(values[:3]))
+    warnings.warn(
+        f"{len(values)} valor(es) não numérico(s) convertido(s) para NaN (ex: {examples})",
+        stacklevel=3
+    )
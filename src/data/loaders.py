@@ -1,24 +1,98 @@
+import numpy as np
 import pandas as pd
 import os
-from typing import Dict, List, Optional, Tuple
+import hashlib
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 from .preprocessors import (
-    CurrencyExtractor, 
-    ColumnRenamer, 
-    DateTimeConverter, 
-    FloatConverter, 
     MonthlyAggregator,
-    DateFilter,
     MonthlyFirstAggregator,
     MonthlyLastAggregator,
-    PreprocessingPipeline
+    PreprocessingPipeline,
+    ParquetExporter,
+    Y_DTYPE,
+    build_ds_y_frame,
+    categorical_unique_id
 )
 from src.utils.find_root import get_project_root
 
+try:
+    import polars as pl
+except ImportError:  # polars é opcional; sem ele usamos o pipeline pandas
+    pl = None
+
+# Liga o carregamento via Polars (lazy + multithread) quando o pacote está instalado
+USE_POLARS = False
+
+# SMP_DEBUG_CHECKS=1 confere a ordenação (unique_id, ds) do resultado concatenado
+DEBUG_CHECKS = bool(os.environ.get('SMP_DEBUG_CHECKS'))
+
+
+def _sort_by_ds(df: pd.DataFrame) -> pd.DataFrame:
+    """Ordena uma série por 'ds' (NaT no fim), só se ainda não estiver ordenada."""
+    if df['ds'].is_monotonic_increasing:
+        return df
+    return df.sort_values('ds', kind='stable', ignore_index=True)
+
+
+def _reduce_stream_batch(df: pd.DataFrame, monthly_aggregation: Optional[str]) -> pd.DataFrame:
+    """
+    Reduz um bloco do CSV aos parciais necessários para a agregação mensal.
+    
+    Args:
+        df: Bloco já no formato ['ds', 'y', 'unique_id']
+        monthly_aggregation: "mean", "first", "last" ou None
+        
+    Returns:
+        Para "mean", soma e contagem de 'y' por mês; para "first"/"last", as linhas
+        candidatas de cada mês; sem agregação, o próprio bloco
+    """
+    if not monthly_aggregation:
+        return df
+    
+    df = df[df['ds'].notna()]
+    year_month = df['ds'].to_numpy().astype('datetime64[M]')
+    if monthly_aggregation == "mean":
+        partial = df['y'].astype(np.float64).groupby(year_month).agg(['sum', 'count'])
+        return partial.rename_axis('year_month').reset_index()
+    
+    # primeiro/último registro do mês e primeiro/último com 'y' válido cobrem first() e last()
+    df = df.assign(year_month=year_month).sort_values('ds', kind='stable')
+    valid = df[df['y'].notna()]
+    candidates = pd.concat([
+        df.groupby('year_month').head(1), df.groupby('year_month').tail(1),
+        valid.groupby('year_month').head(1), valid.groupby('year_month').tail(1),
+    ])
+    candidates = candidates[~candidates.index.duplicated()].sort_index()
+    return candidates[['ds', 'y', 'unique_id']]
+
+
+def _load_one(args: Tuple) -> pd.DataFrame:
+    """Carrega uma commodity em um processo do pool (precisa ser picklável)."""
+    return CommodityLoader.load_commodity(*args)
 
 
 class CommodityLoader:
     """Carregador unificado para commodities."""
     
+    # Diretório (relativo ao root) dos resultados já preprocessados em Parquet
+    CACHE_DIR = 'data/cache'
+    
+    # Pipelines por tipo de agregação mensal; os preprocessadores não guardam estado
+    _AGGREGATION_PIPELINES = {
+        None: PreprocessingPipeline([]),
+        "mean": PreprocessingPipeline([MonthlyAggregator()]),
+        "first": PreprocessingPipeline([MonthlyFirstAggregator()]),
+        "last": PreprocessingPipeline([MonthlyLastAggregator()]),
+    }
+    
+    # Loaders especializados por commodity, criados sob demanda por _get_compiled_loader
+    _compiled_loaders: Dict[str, Callable[..., pd.DataFrame]] = {}
     
     COMMODITY_CONFIGS = {
         'acucar_santos': {
@@ -111,7 +185,20 @@ class CommodityLoader:
         }
     }
     
+    # Conjunto fixo de ids: toda série usa as mesmas categorias, então o concat preserva o dtype
+    ALL_UNIQUE_IDS = sorted(config['unique_id'] for config in COMMODITY_CONFIGS.values())
+    # dtype único de 'unique_id': frames vazios (ex: série sem linhas antes de limit_date)
+    # perdem as categorias na leitura do Parquet e fariam o concat cair para object
+    UNIQUE_ID_DTYPE = pd.CategoricalDtype(ALL_UNIQUE_IDS)
+    
+    # Versão do formato dos arquivos de cache (entra na chave)
+    CACHE_VERSION = 2
+    
+    # Tamanho do bloco lido por vez com streaming=True
+    STREAM_BLOCK_SIZE = 256 << 10
+    
     @classmethod
+    @lru_cache(maxsize=None)
     def _get_absolute_path(cls, relative_path: str) -> str:
         """
         Converte caminho relativo para absoluto baseado no root do projeto.
@@ -122,13 +209,220 @@ class CommodityLoader:
         Returns:
             Caminho absoluto para o arquivo
         """
-        project_root = get_project_root()
-        return os.path.join(project_root, relative_path)
+        return os.path.join(get_project_root(), relative_path)
+    
+    @classmethod
+    def _get_cache_path(cls, absolute_path: str, currency: str,
+                        monthly_aggregation: Optional[str], limit_date: Optional[str]) -> str:
+        """
+        Monta o caminho do cache Parquet para uma combinação de arquivo e parâmetros.
+        
+        A chave inclui o mtime do CSV, então editar o arquivo invalida o cache,
+        e o tipo de 'y' e CACHE_VERSION, para não servir um cache em outro formato.
+        
+        Args:
+            absolute_path: Caminho absoluto do CSV de origem
+            currency: Moeda carregada
+            monthly_aggregation: Tipo de agregação mensal
+            limit_date: Data limite aplicada
+            
+        Returns:
+            Caminho absoluto do arquivo de cache
+        """
+        raw_key = (f"{absolute_path}|{os.path.getmtime(absolute_path)}|{currency}|{monthly_aggregation}"
+                   f"|{limit_date}|{np.dtype(Y_DTYPE).name}|v{cls.CACHE_VERSION}")
+        key = hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+        return os.path.join(cls._get_absolute_path(cls.CACHE_DIR), f"{key}.parquet")
+    
+    @staticmethod
+    def _pushdown_limit(monthly_aggregation: Optional[str], limit_date: Optional[str],
+                        date_format: str) -> Optional[pd.Timestamp]:
+        """
+        Data limite que pode ser aplicada na leitura do cache em vez de no preprocessamento.
+        
+        Sem agregação o filtro comuta com o pipeline. Com agregação mensal isso só vale
+        para limites no dia 1: cortar no meio do mês mudaria o valor agregado daquele mês.
+        
+        Args:
+            monthly_aggregation: Tipo de agregação mensal
+            limit_date: Data limite (formato date_format)
+            date_format: Formato de limit_date
+            
+        Returns:
+            Timestamp do limite, ou None se ele precisa ser aplicado antes da agregação
+        """
+        if not limit_date:
+            return None
+        limit_ts = pd.to_datetime(limit_date, format=date_format)
+        if monthly_aggregation and limit_ts != limit_ts.normalize().replace(day=1):
+            return None
+        return limit_ts
+    
+    @classmethod
+    def _with_unique_id_dtype(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Garante 'unique_id' com as categorias de todas as commodities (sem cópia se já estiver)."""
+        if df['unique_id'].dtype != cls.UNIQUE_ID_DTYPE:
+            df['unique_id'] = df['unique_id'].astype(cls.UNIQUE_ID_DTYPE)
+        return df
+    
+    @classmethod
+    def _read_cache(cls, cache_path: str, limit_ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """
+        Lê um cache Parquet mapeando o arquivo em memória.
+        
+        self_destruct libera cada buffer Arrow assim que o pandas assume a coluna,
+        então o pico de memória fica próximo do tamanho do DataFrame final.
+        
+        Args:
+            cache_path: Caminho do arquivo de cache
+            limit_ts: Se informado, só linhas com ds < limit_ts são lidas (filtro
+                aplicado pelo Arrow, pulando row groups pelas estatísticas)
+            
+        Returns:
+            DataFrame com colunas ['ds', 'y', 'unique_id']
+        """
+        filters = [('ds', '<', limit_ts)] if limit_ts is not None else None
+        table = pq.read_table(
+            cache_path, columns=['ds', 'y', 'unique_id'], filters=filters,
+            memory_map=True, use_threads=True
+        )
+        return cls._with_unique_id_dtype(table.to_pandas(split_blocks=True, self_destruct=True))
+    
+    @classmethod
+    def _read_csv_arrow(cls, absolute_path: str, config: Dict, value_col: str,
+                        date_format: str) -> pd.DataFrame:
+        """
+        Lê só as colunas de data e preço com o leitor CSV multithread do Arrow.
+        
+        Datas e vírgula decimal são convertidas durante o parsing. Se algum valor
+        não converter, relê as duas colunas como string e deixa a conversão
+        (com NaN/NaT para inválidos) para build_ds_y_frame.
+        
+        Args:
+            absolute_path: Caminho absoluto do CSV
+            config: Configuração da commodity em COMMODITY_CONFIGS
+            value_col: Coluna de preços da moeda escolhida
+            date_format: Formato das datas no CSV
+            
+        Returns:
+            DataFrame com as colunas de data e preço
+        """
+        read_options = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+        parse_options = pacsv.ParseOptions(delimiter=config.get('separator', ','))
+        try:
+            table = pacsv.read_csv(absolute_path, read_options=read_options, parse_options=parse_options,
+                                   convert_options=cls._csv_convert_options(config, value_col, date_format))
+        except pa.ArrowInvalid:
+            table = pacsv.read_csv(absolute_path, read_options=read_options, parse_options=parse_options,
+                                   convert_options=cls._csv_convert_options(config, value_col, date_format,
+                                                                            typed=False))
+        return table.to_pandas()
+    
+    @staticmethod
+    def _csv_convert_options(config: Dict, value_col: str, date_format: str,
+                             typed: bool = True) -> pacsv.ConvertOptions:
+        """
+        Opções de conversão do leitor CSV do Arrow para as colunas de data e preço.
+        
+        Args:
+            config: Configuração da commodity em COMMODITY_CONFIGS
+            value_col: Coluna de preços da moeda escolhida
+            date_format: Formato das datas no CSV
+            typed: Se True, converte datas e vírgula decimal no parsing; se False,
+                lê as duas colunas como string
+            
+        Returns:
+            pacsv.ConvertOptions com projeção nas duas colunas
+        """
+        date_col = config['date_column']
+        if not typed:
+            return pacsv.ConvertOptions(
+                include_columns=[date_col, value_col],
+                column_types={date_col: pa.string(), value_col: pa.string()}
+            )
+        return pacsv.ConvertOptions(
+            include_columns=[date_col, value_col],
+            column_types={date_col: pa.timestamp('ns'), value_col: pa.from_numpy_dtype(np.dtype(Y_DTYPE))},
+            timestamp_parsers=[date_format],
+            decimal_point=','
+        )
+    
+    @classmethod
+    def _load_commodity_streaming(cls, config: Dict, absolute_path: str, value_col: str,
+                                  date_format: str, monthly_aggregation: Optional[str],
+                                  limit_date: Optional[str]) -> pd.DataFrame:
+        """
+        Lê o CSV em blocos e agrega incrementalmente, limitando o pico de memória.
+        
+        Cada bloco é convertido, filtrado pela data limite e reduzido a parciais
+        (soma/contagem por mês para "mean"; candidatos a primeiro/último registro
+        de cada mês para "first"/"last"), então só os parciais ficam em memória.
+        O resultado é o mesmo do carregamento em uma única leitura.
+        
+        Args:
+            config: Configuração da commodity em COMMODITY_CONFIGS
+            absolute_path: Caminho absoluto do CSV
+            value_col: Coluna de preços da moeda escolhida
+            date_format: Formato das datas no CSV
+            monthly_aggregation: "mean", "first", "last" ou None
+            limit_date: Data limite para filtrar dados (formato date_format)
+            
+        Returns:
+            DataFrame com colunas ['ds', 'y', 'unique_id']
+        """
+        try:
+            return cls._reduce_csv_stream(config, absolute_path, value_col, date_format,
+                                          monthly_aggregation, limit_date, typed=True)
+        except pa.ArrowInvalid:
+            # valores fora do formato: recomeça lendo como string, com NaN/NaT para inválidos
+            return cls._reduce_csv_stream(config, absolute_path, value_col, date_format,
+                                          monthly_aggregation, limit_date, typed=False)
+    
+    @classmethod
+    def _reduce_csv_stream(cls, config: Dict, absolute_path: str, value_col: str, date_format: str,
+                           monthly_aggregation: Optional[str], limit_date: Optional[str],
+                           typed: bool) -> pd.DataFrame:
+        """Uma passada de _load_commodity_streaming (ver docstring de lá)."""
+        reader = pacsv.open_csv(
+            absolute_path,
+            read_options=pacsv.ReadOptions(block_size=cls.STREAM_BLOCK_SIZE),
+            parse_options=pacsv.ParseOptions(delimiter=config.get('separator', ',')),
+            convert_options=cls._csv_convert_options(config, value_col, date_format, typed)
+        )
+        
+        def to_frame(raw: pd.DataFrame) -> pd.DataFrame:
+            return build_ds_y_frame(
+                raw,
+                date_col=config['date_column'],
+                value_col=value_col,
+                unique_id=config['unique_id'],
+                date_format=date_format,
+                limit_date=limit_date or None,
+                categories=cls.ALL_UNIQUE_IDS
+            )
+        
+        partials = [_reduce_stream_batch(to_frame(batch.to_pandas()), monthly_aggregation) for batch in reader]
+        if not partials:
+            partials = [_reduce_stream_batch(to_frame(reader.schema.empty_table().to_pandas()), monthly_aggregation)]
+        combined = pd.concat(partials, ignore_index=True)
+        
+        if monthly_aggregation != "mean":
+            # sem agregação ou candidatos de first/last: o agregador usual decide
+            return cls._AGGREGATION_PIPELINES[monthly_aggregation or None].fit_transform(combined)
+        
+        totals = combined.groupby('year_month')[['sum', 'count']].sum()
+        y = np.where(totals['count'] > 0, totals['sum'] / totals['count'].where(totals['count'] > 0, 1), np.nan)
+        return pd.DataFrame({
+            'ds': totals.index.to_numpy().astype('datetime64[ns]'),
+            'y': y.astype(Y_DTYPE),
+            'unique_id': categorical_unique_id(config['unique_id'], len(totals), cls.ALL_UNIQUE_IDS)
+        })
     
     @classmethod
     def load_commodity(cls, commodity_name: str, currency: str = 'BRL', 
                       preprocessing: bool = True, monthly_aggregation: Optional[str] = "mean",
-                      limit_date: Optional[str] = None) -> pd.DataFrame:
+                      limit_date: Optional[str] = None, use_cache: bool = True,
+                      streaming: bool = False) -> pd.DataFrame:
         """
         Carrega uma commodity específica com preprocessamento automático.
         
@@ -142,6 +436,9 @@ class CommodityLoader:
                 - "last"  → último dia do mês
                 - None    → sem agregação
             limit_date: Data limite para filtrar dados (formato '%d/%m/%Y')
+            use_cache: Se deve ler/gravar o resultado preprocessado em CACHE_DIR
+            streaming: Se deve ler o CSV em blocos de STREAM_BLOCK_SIZE e agregar
+                incrementalmente (pico de memória independente do tamanho do arquivo)
             
         Returns:
             DataFrame processado com colunas ['ds', 'y', 'unique_id']
@@ -150,57 +447,322 @@ class CommodityLoader:
             raise ValueError(f"Commodity '{commodity_name}' não encontrada. "
                            f"Disponíveis: {list(cls.COMMODITY_CONFIGS.keys())}")
         
+        if preprocessing:
+            return cls._get_compiled_loader(commodity_name)(currency, monthly_aggregation, limit_date,
+                                                            use_cache, streaming)
+        
         config = cls.COMMODITY_CONFIGS[commodity_name]
         absolute_path = cls._get_absolute_path(config['data_path'])
         
         if not os.path.exists(absolute_path):
             raise FileNotFoundError(f"Arquivo não encontrado: {absolute_path}")
         
-        df = pd.read_csv(absolute_path, sep=config.get('separator', ','))
+        return pd.read_csv(absolute_path, sep=config.get('separator', ','))
+    
+    @classmethod
+    def _get_compiled_loader(cls, commodity_name: str) -> Callable[..., pd.DataFrame]:
+        """
+        Retorna o loader especializado da commodity, criando-o na primeira chamada.
+        
+        Caminho absoluto, colunas, unique_id e pipelines de agregação ficam fixados
+        na closure, então chamadas repetidas não refazem lookups nem objetos.
         
-        if not preprocessing:
-            return df
+        Args:
+            commodity_name: Nome da commodity em COMMODITY_CONFIGS
+            
+        Returns:
+            Função (currency, monthly_aggregation, limit_date, use_cache) -> DataFrame
+        """
+        loader = cls._compiled_loaders.get(commodity_name)
+        if loader is None:
+            loader = cls._compile_loader(commodity_name)
+            cls._compiled_loaders[commodity_name] = loader
+        return loader
+    
+    @classmethod
+    def _compile_loader(cls, commodity_name: str) -> Callable[..., pd.DataFrame]:
+        """Monta a closure de carregamento preprocessado de uma commodity."""
+        config = cls.COMMODITY_CONFIGS[commodity_name]
+        absolute_path = cls._get_absolute_path(config['data_path'])
+        date_col = config['date_column']
+        value_cols = config['currency_columns']
+        unique_id = config['unique_id']
+        date_format = config.get('date_format', '%d/%m/%Y')
+        pipelines = cls._AGGREGATION_PIPELINES
         
-        # pipeline
-        preprocessors = []
+        def _loader(currency: str = 'BRL', monthly_aggregation: Optional[str] = "mean",
+                    limit_date: Optional[str] = None, use_cache: bool = True,
+                    streaming: bool = False) -> pd.DataFrame:
+            if not os.path.exists(absolute_path):
+                raise FileNotFoundError(f"Arquivo não encontrado: {absolute_path}")
+            
+            cache_path = None
+            read_limit = None
+            if use_cache:
+                # quando possível o cache guarda a série sem corte e a data limite vira filtro na leitura
+                read_limit = cls._pushdown_limit(monthly_aggregation, limit_date, date_format)
+                if read_limit is not None:
+                    limit_date = None
+                cache_path = cls._get_cache_path(absolute_path, currency, monthly_aggregation, limit_date)
+                if os.path.exists(cache_path):
+                    return cls._read_cache(cache_path, read_limit)
+            
+            if USE_POLARS and pl is not None and not streaming:
+                df = cls._load_commodity_polars(config, absolute_path, currency, monthly_aggregation, limit_date)
+            else:
+                if currency not in value_cols:
+                    raise ValueError(f"Moeda inválida: {currency}")
+                pipeline = pipelines.get(monthly_aggregation or None)
+                if pipeline is None:
+                    raise ValueError("monthly_aggregation deve ser 'mean', 'first', 'last' ou None")
+                
+                if streaming:
+                    df = cls._load_commodity_streaming(config, absolute_path, value_cols[currency], date_format,
+                                                       monthly_aggregation, limit_date)
+                else:
+                    df = cls._read_csv_arrow(absolute_path, config, value_cols[currency], date_format)
+                    # extração, renomeação, conversões e filtro de data em uma única passada
+                    df = build_ds_y_frame(
+                        df,
+                        date_col=date_col,
+                        value_col=value_cols[currency],
+                        unique_id=unique_id,
+                        date_format=date_format,
+                        limit_date=limit_date or None,
+                        categories=cls.ALL_UNIQUE_IDS
+                    )
+                    df = pipeline.fit_transform(df)
+            
+            df = cls._with_unique_id_dtype(_sort_by_ds(df))
+            if cache_path is not None:
+                ParquetExporter.export(df, cache_path, verbose=False)
+            if read_limit is not None:
+                df = df[df['ds'] < read_limit].reset_index(drop=True)
+            return df
         
-        currency_extractor = CurrencyExtractor(
-            currency=currency, 
-            commodity_type=config['commodity_type']
+        return _loader
+    
+    @classmethod
+    def _sorted_by_unique_id(cls, commodity_names) -> List[str]:
+        """Ordena nomes de commodities pelo unique_id (nomes desconhecidos usam o próprio nome)."""
+        return sorted(
+            commodity_names,
+            key=lambda name: cls.COMMODITY_CONFIGS.get(name, {}).get('unique_id', name)
         )
-        df = currency_extractor.transform(df)
+    
+    @staticmethod
+    def _check_sorted(result: pd.DataFrame) -> None:
+        """Confere que o resultado concatenado está ordenado por (unique_id, ds)."""
+        assert result['unique_id'].is_monotonic_increasing, "unique_id fora de ordem"
+        assert result.groupby('unique_id', sort=False)['ds'].apply(
+            lambda ds: ds.is_monotonic_increasing
+        ).all(), "ds fora de ordem dentro de alguma série"
+    
+    @classmethod
+    def _load_in_parallel(cls, commodity_names: List[str], currency: str,
+                          preprocessing: bool, monthly_aggregation: Optional[str],
+                          limit_date: Optional[str]) -> List[pd.DataFrame]:
+        """
+        Carrega as commodities em paralelo, um processo por arquivo.
         
-        cols_dict = {
-            config['date_column']: 'ds',
-            config['currency_columns'][currency]: 'y'
-        }
-        column_renamer = ColumnRenamer(cols_dict, config['unique_id'])
-        preprocessors.append(column_renamer)
+        Falhas individuais são reportadas e ignoradas, como no laço sequencial.
+        
+        Args:
+            commodity_names: Lista de nomes de commodities
+            currency: Moeda desejada ('BRL' ou 'USD')
+            preprocessing: Se deve aplicar preprocessamento básico
+            monthly_aggregation: Tipo de agregação mensal
+            limit_date: Data limite para filtrar dados
+            
+        Returns:
+            DataFrames carregados, na ordem de commodity_names
+        """
+        if not commodity_names:
+            return []
+        
+        loaded = {}
+        max_workers = min(len(commodity_names), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_load_one, (name, currency, preprocessing, monthly_aggregation, limit_date)): name
+                for name in commodity_names
+            }
+            for future in as_completed(futures):
+                commodity_name = futures[future]
+                try:
+                    loaded[commodity_name] = future.result()
+                    print(f"ദ്ദി・ᴗ・)✧ {commodity_name} carregado com sucesso")
+                except Exception as e:
+                    print(f"(⁠╥⁠﹏⁠╥⁠) Erro ao carregar {commodity_name}: {e}")
+        
+        return [loaded[name] for name in commodity_names if name in loaded]
+    
+    @classmethod
+    def _load_with_dataset(cls, commodity_names: List[str], currency: str,
+                           monthly_aggregation: Optional[str],
+                           limit_date: Optional[str]) -> List[pd.DataFrame]:
+        """
+        Carrega várias commodities preprocessadas com um único scan de Dataset Arrow.
+        
+        Arquivos com o mesmo layout (colunas, separador, formato de data) viram um
+        pyarrow.dataset lido em paralelo, com projeção e filtro de data empurrados
+        para o scan. Commodities em cache, com layout inválido ou cujo scan falhe
+        caem no loader individual, que reporta o erro como antes.
+        
+        Args:
+            commodity_names: Lista de nomes de commodities
+            currency: Moeda desejada ('BRL' ou 'USD')
+            monthly_aggregation: Tipo de agregação mensal
+            limit_date: Data limite para filtrar dados
+            
+        Returns:
+            DataFrames carregados, na ordem de commodity_names
+        """
+        pipeline = cls._AGGREGATION_PIPELINES.get(monthly_aggregation or None)
+        loaded = {}
+        individual = []
+        groups = {}
         
-        datetime_converter = DateTimeConverter('ds')
-        preprocessors.append(datetime_converter)
+        for name in commodity_names:
+            config = cls.COMMODITY_CONFIGS.get(name)
+            if pipeline is None or config is None or currency not in config['currency_columns']:
+                individual.append(name)
+                continue
+            absolute_path = cls._get_absolute_path(config['data_path'])
+            date_format = config.get('date_format', '%d/%m/%Y')
+            read_limit = cls._pushdown_limit(monthly_aggregation, limit_date, date_format)
+            scan_limit = limit_date if read_limit is None else None
+            if not os.path.exists(absolute_path) or os.path.exists(
+                    cls._get_cache_path(absolute_path, currency, monthly_aggregation, scan_limit)):
+                individual.append(name)
+                continue
+            layout = (config['date_column'], config['currency_columns'][currency],
+                      config.get('separator', ','), date_format, scan_limit, read_limit)
+            groups.setdefault(layout, {})[absolute_path] = name
         
-        float_converter = FloatConverter('y')
-        preprocessors.append(float_converter)
+        for layout, names_by_path in groups.items():
+            date_col, value_col, separator, date_format, scan_limit, read_limit = layout
+            file_format = pads.CsvFileFormat(
+                parse_options=pacsv.ParseOptions(delimiter=separator),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={date_col: pa.timestamp('ns'), value_col: pa.from_numpy_dtype(np.dtype(Y_DTYPE))},
+                    timestamp_parsers=[date_format],
+                    decimal_point=','
+                ),
+                read_options=pacsv.ReadOptions(block_size=1 << 20)
+            )
+            dataset = pads.dataset(list(names_by_path), format=file_format)
+            date_filter = None
+            if scan_limit:
+                limit = pd.to_datetime(scan_limit, format=date_format)
+                date_filter = pads.field(date_col) < pa.scalar(limit, type=pa.timestamp('ns'))
+            scanner = dataset.scanner(
+                columns={'ds': pads.field(date_col), 'y': pads.field(value_col)},
+                filter=date_filter
+            )
+            
+            batches = {path: [] for path in names_by_path}
+            try:
+                for tagged in scanner.scan_batches():
+                    batches[tagged.fragment.path].append(tagged.record_batch)
+            except (pa.ArrowInvalid, OSError):
+                # valores fora do formato: o loader individual relê como string
+                individual.extend(names_by_path.values())
+                continue
+            
+            for path, name in names_by_path.items():
+                try:
+                    table = pa.Table.from_batches(batches[path], schema=scanner.projected_schema)
+                    config = cls.COMMODITY_CONFIGS[name]
+                    df = pd.DataFrame({
+                        'ds': table['ds'].to_pandas(),
+                        'y': table['y'].to_numpy(),
+                        'unique_id': categorical_unique_id(config['unique_id'], table.num_rows, cls.ALL_UNIQUE_IDS)
+                    })
+                    df = cls._with_unique_id_dtype(_sort_by_ds(pipeline.fit_transform(df)))
+                    ParquetExporter.export(
+                        df, cls._get_cache_path(path, currency, monthly_aggregation, scan_limit), verbose=False
+                    )
+                except Exception:
+                    # falha isolada desta série: o loader individual tenta de novo e reporta o erro
+                    individual.append(name)
+                    continue
+                if read_limit is not None:
+                    df = df[df['ds'] < read_limit].reset_index(drop=True)
+                loaded[name] = df
+                print(f"ദ്ദി・ᴗ・)✧ {name} carregado com sucesso")
+        
+        for name in individual:
+            try:
+                loaded[name] = cls.load_commodity(
+                    commodity_name=name,
+                    currency=currency,
+                    monthly_aggregation=monthly_aggregation,
+                    limit_date=limit_date
+                )
+                print(f"ദ്ദി・ᴗ・)✧ {name} carregado com sucesso")
+            except Exception as e:
+                print(f"(⁠╥⁠﹏⁠╥⁠) Erro ao carregar {name}: {e}")
+        
+        return [loaded[name] for name in commodity_names if name in loaded]
+    
+    @classmethod
+    def _load_commodity_polars(cls, config: Dict, absolute_path: str, currency: str,
+                               monthly_aggregation: Optional[str],
+                               limit_date: Optional[str]) -> pd.DataFrame:
+        """
+        Versão Polars do preprocessamento de load_commodity.
+        
+        Leitura, conversões, filtro e agregação rodam em um único plano lazy;
+        a conversão para pandas acontece só no retorno.
+        
+        Args:
+            config: Configuração da commodity em COMMODITY_CONFIGS
+            absolute_path: Caminho absoluto do CSV
+            currency: Moeda desejada ('BRL' ou 'USD')
+            monthly_aggregation: "mean", "first", "last" ou None
+            limit_date: Data limite para filtrar dados (formato '%d/%m/%Y')
+            
+        Returns:
+            DataFrame com colunas ['ds', 'y', 'unique_id'], no mesmo formato do pipeline pandas
+        """
+        if currency not in config['currency_columns']:
+            raise ValueError(f"Moeda inválida: {currency}")
+        if monthly_aggregation not in (None, "mean", "first", "last"):
+            raise ValueError("monthly_aggregation deve ser 'mean', 'first', 'last' ou None")
+        
+        date_format = config.get('date_format', '%d/%m/%Y')
+        lf = pl.scan_csv(
+            absolute_path,
+            separator=config.get('separator', ','),
+            # tudo como string: vírgula decimal e datas são tratadas explicitamente abaixo
+            infer_schema=False
+        ).select(
+            pl.col(config['date_column']).str.strptime(pl.Datetime('ns'), date_format, strict=False).alias('ds'),
+            pl.col(config['currency_columns'][currency]).str.replace(',', '.', literal=True)
+              .cast(pl.Float32 if np.dtype(Y_DTYPE) == np.float32 else pl.Float64, strict=False).alias('y'),
+            pl.lit(config['unique_id']).alias('unique_id')
+        )
         
         if limit_date:
-            date_filter = DateFilter(limit_date, 'ds')
-            preprocessors.append(date_filter)
+            lf = lf.filter(pl.col('ds') < pd.to_datetime(limit_date, format=date_format))
         
         if monthly_aggregation:
+            # group_by sobre o mês truncado: "last" precisa manter a data real do último registro
+            month = pl.col('ds').dt.truncate('1mo').alias('year_month')
             if monthly_aggregation == "mean":
-                aggregator = MonthlyAggregator()
+                aggs = [pl.col('y').mean()]
             elif monthly_aggregation == "first":
-                aggregator = MonthlyFirstAggregator()
-            elif monthly_aggregation == "last":
-                aggregator = MonthlyLastAggregator()
+                aggs = [pl.col('y').drop_nulls().first()]
             else:
-                raise ValueError("monthly_aggregation deve ser 'mean', 'first', 'last' ou None")
-            preprocessors.append(aggregator)
-        
-        pipeline = PreprocessingPipeline(preprocessors)
-        df = pipeline.fit_transform(df)
+                aggs = [pl.col('ds').drop_nulls().last(), pl.col('y').drop_nulls().last()]
+            lf = lf.sort('ds').group_by([month, 'unique_id'], maintain_order=True).agg(aggs)
+            if monthly_aggregation != "last":
+                lf = lf.rename({'year_month': 'ds'})
+            lf = lf.select(['ds', 'y', 'unique_id']).sort('ds')
         
+        df = lf.collect(engine="streaming").to_pandas()
+        df['unique_id'] = pd.Categorical(df['unique_id'], categories=cls.ALL_UNIQUE_IDS)
         return df
     
     @classmethod
@@ -220,28 +782,23 @@ class CommodityLoader:
         Returns:
             DataFrame concatenado com todas as commodities
         """
-        dfs = []
-        
-        for commodity_name in cls.COMMODITY_CONFIGS.keys():
-            try:
-                df = cls.load_commodity(
-                    commodity_name=commodity_name,
-                    currency=currency,
-                    preprocessing=preprocessing,
-                    monthly_aggregation=monthly_aggregation,
-                    limit_date=limit_date
-                )
-                dfs.append(df)
-                print(f"ദ്ദി・ᴗ・)✧ {commodity_name} carregado com sucesso")
-            except Exception as e:
-                print(f"(⁠╥⁠﹏⁠╥⁠) Erro ao carregar {commodity_name}: {e}")
-                continue
+        commodity_names = cls._sorted_by_unique_id(cls.COMMODITY_CONFIGS.keys())
+        if preprocessing and not USE_POLARS:
+            dfs = cls._load_with_dataset(commodity_names, currency, monthly_aggregation, limit_date)
+        else:
+            dfs = cls._load_in_parallel(
+                commodity_names, currency, preprocessing, monthly_aggregation, limit_date
+            )
         
         if not dfs:
             raise ValueError("Nenhuma commodity foi carregada com sucesso")
         
+        # cada frame já vem ordenado por 'ds' e na ordem de unique_id: dispensa o sort global
         result = pd.concat(dfs, axis=0, ignore_index=True)
-        result = result.sort_values(['unique_id', 'ds']).reset_index(drop=True)
+        if preprocessing:
+            cls._with_unique_id_dtype(result)
+        if DEBUG_CHECKS and preprocessing:
+            cls._check_sorted(result)
         
         return result
     
@@ -264,28 +821,23 @@ class CommodityLoader:
         Returns:
             DataFrame concatenado com as commodities selecionadas
         """
-        dfs = []
-        
-        for commodity_name in commodity_names:
-            try:
-                df = cls.load_commodity(
-                    commodity_name=commodity_name,
-                    currency=currency,
-                    preprocessing=preprocessing,
-                    monthly_aggregation=monthly_aggregation,
-                    limit_date=limit_date
-                )
-                dfs.append(df)
-                print(f"ദ്ദി・ᴗ・)✧ {commodity_name} carregado com sucesso")
-            except Exception as e:
-                print(f"(⁠╥⁠﹏⁠╥⁠) Erro ao carregar {commodity_name}: {e}")
-                continue
+        commodity_names = cls._sorted_by_unique_id(commodity_names)
+        if preprocessing and not USE_POLARS:
+            dfs = cls._load_with_dataset(commodity_names, currency, monthly_aggregation, limit_date)
+        else:
+            dfs = cls._load_in_parallel(
+                commodity_names, currency, preprocessing, monthly_aggregation, limit_date
+            )
         
         if not dfs:
             raise ValueError("Nenhuma commodity foi carregada com sucesso")
         
+        # cada frame já vem ordenado por 'ds' e na ordem de unique_id: dispensa o sort global
         result = pd.concat(dfs, axis=0, ignore_index=True)
-        result = result.sort_values(['unique_id', 'ds']).reset_index(drop=True)
+        if preprocessing:
+            cls._with_unique_id_dtype(result)
+        if DEBUG_CHECKS and preprocessing:
+            cls._check_sorted(result)
         
         return result
     
@@ -1,7 +1,62 @@
 import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
+from scripts.time_series_preprocessing import PARQUET_WRITE_OPTIONS
+from ._fastparse import NUMBA_AVAILABLE, parse_decimal_comma, warn_unparsed
+
+# Tipo da coluna 'y' em todo o pipeline: preços diários têm 4-6 dígitos significativos
+Y_DTYPE = np.float32
+
+
+def _decimal_comma_to_float(values: pd.Series) -> Any:
+    """Converte preços com vírgula decimal para Y_DTYPE (inválidos viram NaN, com aviso)."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(Y_DTYPE)
+    if NUMBA_AVAILABLE:
+        return parse_decimal_comma(values).astype(Y_DTYPE)
+    
+    # replace + cast em kernels do Arrow: uma passada sobre o buffer de strings, sem objetos Python
+    arr = pc.replace_substring(pa.array(values, type=pa.string(), from_pandas=True), pattern=',', replacement='.')
+    try:
+        return pc.cast(arr, pa.from_numpy_dtype(np.dtype(Y_DTYPE))).to_numpy(zero_copy_only=False)
+    except pa.ArrowInvalid:
+        # o cast do Arrow é estrito; valores inválidos viram NaN pelo pandas, com o mesmo aviso do kernel
+        text = pd.Series(arr.to_pandas())
+        out = pd.to_numeric(text, errors='coerce').to_numpy(dtype=Y_DTYPE)
+        invalid = np.isnan(out) & text.str.strip().fillna('').ne('').to_numpy()
+        if invalid.any():
+            warn_unparsed(text[invalid].to_numpy(dtype=object))
+        return out
+
+
+def _month_start(ds: pd.Series) -> np.ndarray:
+    """Trunca datas para o início do mês no numpy (chave de agrupamento sem Period)."""
+    values = ds.to_numpy()
+    return values.astype('datetime64[M]').astype(values.dtype)
+
+
+def categorical_unique_id(unique_id: str, n: int, categories: Optional[List[str]] = None) -> pd.Categorical:
+    """
+    Coluna 'unique_id' categórica: códigos inteiros e um único dicionário de nomes.
+    
+    Args:
+        unique_id: Identificador repetido em todas as linhas
+        n: Número de linhas
+        categories: Conjunto completo de ids; frames com as mesmas categorias
+            continuam categóricos após pd.concat. Padrão: só [unique_id]
+        
+    Returns:
+        pd.Categorical de tamanho n
+    """
+    categories = list(categories) if categories else [unique_id]
+    code_dtype = np.int8 if len(categories) < 128 else np.int32
+    codes = np.full(n, categories.index(unique_id), dtype=code_dtype)
+    return pd.Categorical.from_codes(codes, categories=categories)
 
 
 class BasePreprocessor(ABC):
@@ -38,18 +93,18 @@ class CurrencyExtractor(BasePreprocessor):
     def _extract_standard_series(self, df: pd.DataFrame) -> Any:
         """Extrai série para commodities padrão."""
         if self.currency == "BRL":
-            return df[['Data', 'À vista R$']].copy()
+            return df[['Data', 'À vista R$']]
         elif self.currency == "USD":
-            return df[['Data', 'À vista US$']].copy()
+            return df[['Data', 'À vista US$']]
         else:
             raise ValueError(f"Moeda inválida: {self.currency}")
     
     def _extract_algodao_series(self, df: pd.DataFrame) -> Any:
         """Extrai série específica para algodão."""
         if self.currency == "BRL":
-            return df[['Data', 'Prazo de 8 dias R$']].copy()
+            return df[['Data', 'Prazo de 8 dias R$']]
         elif self.currency == "USD":
-            return df[['Data', 'Prazo de 8 dias US$']].copy()
+            return df[['Data', 'Prazo de 8 dias US$']]
         else:
             raise ValueError(f"Moeda inválida: {self.currency}")
 
@@ -81,17 +136,18 @@ class CurrencySplitter(BasePreprocessor):
         Returns:
             Tuple com dois DataFrames: um com dados em reais e outro em dólares
         """
-        df_brl = df[['Data', 'À vista R$']].copy()
-        df_usd = df[['Data', 'À vista US$']].copy()
+        df_brl = df[['Data', 'À vista R$']]
+        df_usd = df[['Data', 'À vista US$']]
         return df_brl, df_usd
 
 
 class ColumnRenamer(BasePreprocessor):
     """Renomeia colunas e adiciona identificador único."""
     
-    def __init__(self, cols_dict: Dict[str, str], unique_id: str):
+    def __init__(self, cols_dict: Dict[str, str], unique_id: str, categories: Optional[List[str]] = None):
         self.cols_dict = cols_dict
         self.unique_id = unique_id
+        self.categories = categories
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -101,10 +157,10 @@ class ColumnRenamer(BasePreprocessor):
             df: DataFrame original
             
         Returns:
-            DataFrame com colunas renomeadas e nova coluna 'unique_id'
+            DataFrame com colunas renomeadas e nova coluna 'unique_id' (categórica)
         """
         df = df.rename(columns=self.cols_dict, inplace=False)
-        df['unique_id'] = self.unique_id
+        df['unique_id'] = categorical_unique_id(self.unique_id, len(df), self.categories)
         return df
 
 
@@ -125,8 +181,7 @@ class DateTimeConverter(BasePreprocessor):
         Returns:
             DataFrame com a coluna convertida para datetime
         """
-        df = df.copy()
-        df[self.column] = pd.to_datetime(df[self.column], format=self.date_format, errors='coerce')
+        df[self.column] = pd.to_datetime(df[self.column], format=self.date_format, errors='coerce', cache=True)
         return df
 
 
@@ -146,9 +201,11 @@ class FloatConverter(BasePreprocessor):
         Returns:
             DataFrame com a coluna alvo convertida para tipo float
         """
-        df = df.copy()
-        df[self.column] = df[self.column].astype(str).str.replace(',', '.', regex=False)
-        df[self.column] = df[self.column].astype(float)
+        # frames já tipados pelo leitor Arrow não precisam de nova passada
+        if df[self.column].dtype == Y_DTYPE:
+            return df
+        
+        df[self.column] = _decimal_comma_to_float(df[self.column])
         return df
 
 
@@ -165,12 +222,11 @@ class MonthlyAggregator(BasePreprocessor):
         Returns:
             DataFrame com a média mensal por 'unique_id' no formato adequado para modelagem temporal
         """
-        df = df.copy()
-        df['ds'] = pd.to_datetime(df['ds'])
-        df['year_month'] = df['ds'].dt.to_period('M')
-
-        df_monthly = df.groupby(['year_month', 'unique_id']).agg({'y': 'mean'}).reset_index()
-        df_monthly['ds'] = pd.to_datetime(df_monthly['year_month'].astype(str) + '-01')
+        df_monthly = (df.assign(year_month=_month_start(df['ds']))
+                        .groupby(['unique_id', 'year_month'], observed=True)['y']
+                        .mean()
+                        .reset_index()
+                        .rename(columns={'year_month': 'ds'}))
         df_monthly = df_monthly[['ds', 'y', 'unique_id']]
         
         return df_monthly
@@ -179,13 +235,13 @@ class MonthlyFirstAggregator(BasePreprocessor):
     """Agrega dados pegando o primeiro valor de cada mês."""
     
     def transform(self, df: pd.DataFrame) -> Any:
-        df = df.copy()
-        df['ds'] = pd.to_datetime(df['ds'])
-        df['year_month'] = df['ds'].dt.to_period('M')
-
         # Pega o primeiro registro de cada grupo
-        df_first = df.sort_values('ds').groupby(['year_month', 'unique_id']).first().reset_index()
-        df_first['ds'] = pd.to_datetime(df_first['year_month'].astype(str) + '-01')
+        df_first = (df.sort_values('ds')
+                      .assign(year_month=lambda d: _month_start(d['ds']))
+                      .groupby(['unique_id', 'year_month'], observed=True)['y']
+                      .first()
+                      .reset_index()
+                      .rename(columns={'year_month': 'ds'}))
         df_first = df_first[['ds', 'y', 'unique_id']]
 
         return df_first
@@ -195,14 +251,12 @@ class MonthlyLastAggregator(BasePreprocessor):
     """Agrega dados pegando o último valor de cada mês."""
     
     def transform(self, df: pd.DataFrame) -> Any:
-        df = df.copy()
-        df['ds'] = pd.to_datetime(df['ds'])
-        df['year_month'] = df['ds'].dt.to_period('M')
-
-        # Pega o último registro de cada grupo
-        df_last = df.sort_values('ds').groupby(['year_month', 'unique_id']).last().reset_index()
-        # A data real do último registro
-        df_last['ds'] = df_last['ds']
+        # Pega o último registro de cada grupo; 'ds' fica com a data real do último registro
+        df_last = (df.sort_values('ds')
+                     .assign(year_month=lambda d: _month_start(d['ds']))
+                     .groupby(['unique_id', 'year_month'], observed=True)[['ds', 'y']]
+                     .last()
+                     .reset_index())
         df_last = df_last[['ds', 'y', 'unique_id']]
 
         return df_last
@@ -215,6 +269,8 @@ class DateFilter(BasePreprocessor):
         self.limit_date = limit_date
         self.column_date = column_date
         self.date_format = date_format
+        # convertida uma única vez, não a cada transform
+        self.limit_ts = pd.to_datetime(limit_date, format=date_format)
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -226,29 +282,72 @@ class DateFilter(BasePreprocessor):
         Returns:
             DataFrame filtrado com apenas as linhas anteriores à data limite
         """
-        limit_date = pd.to_datetime(self.limit_date, format=self.date_format)
-        df = df[df[self.column_date] < limit_date] # type: ignore
+        df = df[df[self.column_date] < self.limit_ts] # type: ignore
         return df
 
 
+def build_ds_y_frame(df: pd.DataFrame, date_col: str, value_col: str, unique_id: str,
+                     date_format: str = '%d/%m/%Y', limit_date: Optional[str] = None,
+                     categories: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Monta o frame ['ds', 'y', 'unique_id'] direto das colunas brutas em uma única passada.
+    
+    Equivale a CurrencyExtractor → ColumnRenamer → DateTimeConverter → FloatConverter
+    → DateFilter, sem materializar um DataFrame intermediário a cada etapa.
+    
+    Args:
+        df: DataFrame bruto lido do CSV
+        date_col: Coluna de datas
+        value_col: Coluna de preços da moeda escolhida
+        unique_id: Identificador da série
+        date_format: Formato das datas quando ainda estão como string
+        limit_date: Data limite (exclusiva) no formato date_format
+        categories: Conjunto de ids da coluna categórica 'unique_id'
+        
+    Returns:
+        DataFrame com colunas 'ds', 'y' e 'unique_id'
+    """
+    ds = df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(ds):
+        ds = pd.to_datetime(ds, format=date_format, errors='coerce', cache=True)
+    
+    y = df[value_col]
+    if y.dtype != Y_DTYPE:
+        y = _decimal_comma_to_float(y)
+    
+    out = pd.DataFrame({
+        # mesma resolução dos Parquets do projeto, seja qual for o caminho de parsing
+        'ds': ds.to_numpy().astype('datetime64[ns]', copy=False),
+        'y': np.asarray(y),
+        'unique_id': categorical_unique_id(unique_id, len(df), categories)
+    })
+    if limit_date is not None:
+        out = out[out['ds'] < pd.to_datetime(limit_date, format=date_format)]
+    return out
+
+
 class ParquetExporter:
     """Salva DataFrame em formato Parquet."""
     
-    @staticmethod
-    def export(df: pd.DataFrame, path_parquet: str) -> None:
+    WRITE_OPTIONS = PARQUET_WRITE_OPTIONS
+    
+    @classmethod
+    def export(cls, df: pd.DataFrame, path_parquet: str, verbose: bool = True, **write_options) -> None:
         """
         Salva um DataFrame em formato Parquet no caminho especificado.
         
         Args:
             df: DataFrame a ser salvo
             path_parquet: Caminho completo para salvar o arquivo .parquet
+            verbose: Se True, informa o caminho salvo (o cache dos loaders grava em silêncio)
+            **write_options: Sobrescrevem WRITE_OPTIONS (ex: row_group_size para tabelas pequenas)
         """
-        dir_final = os.path.dirname(path_parquet)
-        if not os.path.exists(dir_final):
-            os.makedirs(dir_final)
+        os.makedirs(os.path.dirname(path_parquet) or '.', exist_ok=True)
 
-        df.to_parquet(path_parquet, engine="pyarrow")
-        print(f'Arquivo salvo em: {path_parquet}')
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, path_parquet, **{**cls.WRITE_OPTIONS, **write_options})
+        if verbose:
+            print(f'Arquivo salvo em: {path_parquet}')
 
 
 class PreprocessingPipeline:
@@ -261,13 +360,16 @@ class PreprocessingPipeline:
         """
         Aplica todos os preprocessadores na ordem especificada.
         
+        O pipeline passa a ser dono do frame: os conversores alteram colunas in-place,
+        então o chamador não deve reutilizar `df` depois da chamada.
+        
         Args:
             df: DataFrame original
             
         Returns:
             DataFrame após todas as transformações
         """
-        result = df.copy()
+        result = df
         for preprocessor in self.preprocessors:
             result = preprocessor.transform(result)
         return result
@@ -310,13 +412,13 @@ def rename_columns_and_set_id(df: pd.DataFrame, cols_dict: Dict[str, str], uniqu
 def convert_column_to_datetime(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """Função de compatibilidade para converter datas."""
     converter = DateTimeConverter(column)
-    return converter.transform(df)
+    return converter.transform(df.copy())
 
 
 def convert_column_to_float(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """Função de compatibilidade para converter floats."""
     converter = FloatConverter(column)
-    return converter.transform(df)
+    return converter.transform(df.copy())
 
 
 def aggregate_monthly_mean(df: pd.DataFrame) -> pd.DataFrame:
@@ -331,6 +433,6 @@ def drop_over_limit_date(df: pd.DataFrame, limit_date: str, column_date: str) ->
     return filter_obj.transform(df)
 
 
-def export_to_parquet(df: pd.DataFrame, path_parquet: str) -> None:
+def export_to_parquet(df: pd.DataFrame, path_parquet: str, **write_options) -> None:
     """Função de compatibilidade para exportar parquet."""
-    ParquetExporter.export(df, path_parquet) 
\ No newline at end of file
+    ParquetExporter.export(df, path_parquet, **write_options) 
\ No newline at end of file
@@ -6,8 +6,11 @@ from sklearn.metrics import (
     root_mean_squared_error,
     r2_score
 )
-from typing import List, Dict, Callable, Optional
+from typing import List, Dict, Callable, Optional, Tuple
 import numpy as np
+from joblib import Parallel, delayed
+
+_EPS = np.finfo(np.float64).eps
 
 
 class MetricRegistry:
@@ -38,6 +41,10 @@ class MetricRegistry:
         """Lista métricas disponíveis"""
         return list(cls.METRICS.keys())
     
+# Métricas que _evaluate_grouped calcula vetorizadas (se não tiverem sido substituídas no registry)
+_VECTORIZED_METRICS = dict(MetricRegistry.METRICS)
+
+
 class MetricEvaluator:
     """Avaliador de métricas para previsões de séries temporais"""
 
@@ -50,6 +57,8 @@ class MetricEvaluator:
         """
         self.metrics = metrics or MetricRegistry.list_metrics()
         self._validate_metrics()
+        # funções resolvidas uma única vez, fora do laço de avaliação
+        self._metric_fns = [(name, MetricRegistry.METRICS[name]) for name in self.metrics]
 
     def _validate_metrics(self):
         """Valida se as métricas solicitadas existem"""
@@ -58,19 +67,26 @@ class MetricEvaluator:
         if invalid:
             raise ValueError(f"Métricas inválidas: {invalid}. Disponíveis: {available}")
         
-    def evaluate_single(self, y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    def evaluate_single(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        metrics: Optional[List[str]] = None
+    ) -> Dict[str, float]:
         """
         Avalia previsões para uma única série
 
         Args:
             y_true: Valores reais
             y_pred: Valores previstos
+            metrics: Subconjunto de métricas a calcular. Se None, usa self.metrics
         """
         results = {}
+        metric_fns = self._metric_fns
+        if metrics is not None:
+            metric_fns = [(name, fn) for name, fn in metric_fns if name in metrics]
 
-        for metric_name in self.metrics:
-            metric_func = MetricRegistry.get_metric(metric_name)
-
+        for metric_name, metric_func in metric_fns:
             try:
                 results[metric_name] = metric_func(y_true, y_pred)
             except Exception as e:
@@ -98,40 +114,41 @@ class MetricEvaluator:
         Returns:
             DataFrame com métricas por grupo e modelo
         """
-        results = []
-        
-        # Merge dos dataframes
+        # Merge dos dataframes, com a chave categórica compartilhada (hash sobre códigos inteiros)
+        forecasts_df, actual_df = self._categorical_merge_keys(forecasts_df, actual_df, groupby_column)
         merged_df = forecasts_df.merge(actual_df, on=['ds', groupby_column], how='inner')
         
-        for group_name in merged_df[groupby_column].unique():
-            group_data = merged_df[merged_df[groupby_column] == group_name]
-            
-            for model in model_columns:
-                if model in group_data.columns:
-                    # Remove NaN values
-                    mask = ~(group_data['y'].isna() | group_data[model].isna())
-                    y_true = group_data[mask]['y'].values
-                    y_pred = group_data[mask][model].values
-                    
-                    if len(y_true) > 0:
-                        metrics = self.evaluate_single(y_true, y_pred)
-                        
-                        # Criar novo dicionário
-                        result_row = {
-                            groupby_column: group_name,
-                            'Model': model,
-                            'n_observations': len(y_true),
-                            **metrics  # Desempacotar as métricas
-                        }
-                        results.append(result_row)
-        
-        return pd.DataFrame(results)
+        return self._evaluate_grouped(merged_df, model_columns, [groupby_column])
+    
+    @staticmethod
+    def _categorical_merge_keys(
+        left: pd.DataFrame,
+        right: pd.DataFrame,
+        groupby_column: str
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Prepara as chaves do merge: grupo como categoria com as mesmas categorias
+        nos dois lados e 'ds' na mesma resolução
+        """
+        key_dtype = left[groupby_column].dtype
+        if not (isinstance(key_dtype, pd.CategoricalDtype) and key_dtype == right[groupby_column].dtype):
+            categories = pd.Index(left[groupby_column].unique()).union(pd.Index(right[groupby_column].unique()))
+            key_dtype = pd.CategoricalDtype(categories.dropna())
+        
+        frames = []
+        for frame in (left, right):
+            columns = {groupby_column: frame[groupby_column].astype(key_dtype)}
+            if pd.api.types.is_datetime64_dtype(frame['ds']) and frame['ds'].dtype != 'datetime64[ns]':
+                columns['ds'] = frame['ds'].astype('datetime64[ns]')
+            frames.append(frame.assign(**columns))
+        return frames[0], frames[1]
     
     def evaluate_cross_validation(
         self,
         cv_results: pd.DataFrame,
         model_columns: List[str],
-        groupby_column: str = 'unique_id'
+        groupby_column: str = 'unique_id',
+        n_jobs: int = 1
     ) -> pd.DataFrame:
         """
         Avalia resultados de validação cruzada
@@ -140,44 +157,130 @@ class MetricEvaluator:
             cv_results: DataFrame com resultados de CV
             model_columns: Lista de colunas com previsões dos modelos
             groupby_column: Coluna para agrupar
+            n_jobs: Threads para as métricas customizadas por fold (-1 usa todos os núcleos)
             
         Returns:
             DataFrame com métricas por grupo, modelo e fold
         """
-        results = []
+        return self._evaluate_grouped(cv_results, model_columns, [groupby_column, 'cutoff'], n_jobs)
+    
+    def _evaluate_grouped(
+        self,
+        df: pd.DataFrame,
+        model_columns: List[str],
+        keys: List[str],
+        n_jobs: int = 1
+    ) -> pd.DataFrame:
+        """
+        Calcula as métricas de todos os pares (grupo, modelo) em uma única passada vetorizada
+        
+        As previsões ficam em uma matriz (linhas x modelos) e cada métrica padrão sai de
+        somas por grupo ao longo das linhas, para todos os modelos de uma vez; métricas
+        registradas pelo usuário são aplicadas por grupo.
+        
+        Args:
+            df: DataFrame com 'y', as colunas de chave e as colunas dos modelos
+            model_columns: Lista de colunas com previsões dos modelos
+            keys: Colunas que identificam o grupo (ex: ['unique_id', 'cutoff'])
+            n_jobs: Threads para as métricas customizadas, aplicadas fold a fold
+            
+        Returns:
+            DataFrame com uma linha por grupo e modelo, na ordem de aparição dos grupos,
+            com a coluna de grupo e 'Model' categóricas
+        """
+        models = [model for model in model_columns if model in df.columns]
         
-        for group_name in cv_results[groupby_column].unique():
-            group_data = cv_results[cv_results[groupby_column] == group_name]
+        # códigos de grupo na ordem de aparição; linhas com chave ou 'y' nulos ficam de fora
+        groups = df.groupby(keys, sort=False, observed=True)
+        key_index = groups.size().index
+        codes = groups.ngroup().to_numpy(dtype=np.int64, na_value=-1)
+        y = df['y'].to_numpy(dtype=np.float64, copy=False)
+        row_valid = (codes >= 0) & ~np.isnan(y)
+        codes = codes[row_valid]
+        y = y[row_valid]
+        preds = df[models].to_numpy(dtype=np.float64)[row_valid]
+        
+        # matriz de previsões (linhas x modelos): a máscara de 'y' é comum, só a dos modelos varia
+        valid = ~np.isnan(preds)
+        n_groups = len(key_index)
+        
+        def group_sum(values: np.ndarray) -> np.ndarray:
+            """Soma por grupo de cada coluna (modelo), ignorando as posições inválidas"""
+            values = np.where(valid, values, 0.0)
+            return np.column_stack([
+                np.bincount(codes, weights=values[:, col], minlength=n_groups)
+                for col in range(values.shape[1])
+            ]) if values.shape[1] else np.zeros((n_groups, 0))
+        
+        err = preds - y[:, None]
+        abs_err = np.abs(err)
+        n_obs = group_sum(np.ones_like(preds))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_y = group_sum(np.broadcast_to(y[:, None], preds.shape)) / n_obs
+            sse = group_sum(err * err)
+            sst = group_sum((y[:, None] - mean_y[codes]) ** 2)
+            builtin = {
+                'MAE': group_sum(abs_err) / n_obs,
+                # mesmo epsilon do sklearn para evitar divisão por zero
+                'MAPE': group_sum(abs_err / np.maximum(np.abs(y), _EPS)[:, None]) / n_obs,
+                'MSE': sse / n_obs
+            }
+            builtin['RMSE'] = np.sqrt(builtin['MSE'])
+            # regras do r2_score: SST nulo dá 1.0 (ajuste perfeito) ou 0.0; menos de 2 pontos dá NaN
+            r2 = np.where(sst != 0, 1.0 - sse / sst, np.where(sse == 0, 1.0, 0.0))
+            builtin['R2'] = np.where(n_obs >= 2, r2, np.nan)
+        
+        # mesma ordem dos laços originais: grupos por ordem de aparição, modelos na ordem pedida.
+        # Ordenar de forma estável pela primeira chave agrupa os cutoffs de cada série
+        first_codes = pd.factorize(key_index.get_level_values(0))[0]
+        key_order = np.argsort(first_codes, kind='stable')
+        present = (n_obs[key_order] > 0).ravel()
+        if not present.any():
+            return pd.DataFrame()
+        key_pos = np.repeat(key_order, len(models))[present]
+        model_pos = np.tile(np.arange(len(models)), n_groups)[present]
+        
+        results = key_index.take(key_pos).to_frame(index=False)
+        # grupo e modelo saem como categorias: menos memória e groupby por códigos adiante
+        results[keys[0]] = results[keys[0]].astype('category')
+        results['Model'] = pd.Categorical(np.asarray(models, dtype=object)[model_pos])
+        results['n_observations'] = n_obs[key_pos, model_pos].astype(np.int64)
+        for metric_name, metric_func in self._metric_fns:
+            if _VECTORIZED_METRICS.get(metric_name) is metric_func:
+                results[metric_name] = builtin[metric_name][key_pos, model_pos]
+        
+        custom_metrics = [
+            metric_name for metric_name, metric_func in self._metric_fns
+            if _VECTORIZED_METRICS.get(metric_name) is not metric_func
+        ]
+        if custom_metrics:
+            # linhas de cada grupo contíguas: um argsort estável e fatias por grupo
+            order = np.argsort(codes, kind='stable')
+            bounds = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=n_groups))])
             
-            for cutoff in group_data['cutoff'].unique():
-                cutoff_data = group_data[group_data['cutoff'] == cutoff]
-                
-                for model in model_columns:
-                    if model in cutoff_data.columns:
-                        mask = ~(cutoff_data['y'].isna() | cutoff_data[model].isna())
-                        y_true = cutoff_data[mask]['y'].values
-                        y_pred = cutoff_data[mask][model].values
-                        
-                        if len(y_true) > 0:
-                            metrics = self.evaluate_single(y_true, y_pred)
-                            
-                            # Criar novo dicionário
-                            result_row = {
-                                groupby_column: group_name,
-                                'Model': model,
-                                'cutoff': cutoff,
-                                'n_observations': len(y_true),
-                                **metrics  # Desempacotar as métricas
-                            }
-                            results.append(result_row)
-        
-        return pd.DataFrame(results)
+            def fold(group: int, model: int):
+                rows = order[bounds[group]:bounds[group + 1]]
+                rows = rows[valid[rows, model]]
+                return y[rows], preds[rows, model]
+            
+            # folds independentes: com n_jobs != 1 vão para um pool de threads (o numpy libera o GIL)
+            scores = Parallel(n_jobs=n_jobs, prefer='threads')(
+                delayed(self.evaluate_single)(*fold(group, model), custom_metrics)
+                for group, model in zip(key_pos, model_pos)
+            )
+            for metric_name in custom_metrics:
+                results[metric_name] = [score[metric_name] for score in scores]
+        
+        return results[keys[:1] + ['Model'] + keys[1:] + ['n_observations'] + list(self.metrics)]
     
     def add_metric(self, name: str, metric_func: Callable):
         """Adiciona uma nova métrica ao avaliador"""
         MetricRegistry.register_metric(name, metric_func)
         if name not in self.metrics:
             self.metrics.append(name)
+            self._metric_fns.append((name, metric_func))
+        else:
+            self._metric_fns = [(n, metric_func if n == name else fn) for n, fn in self._metric_fns]
     
     def get_summary_stats(self, metrics_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -191,8 +294,10 @@ class MetricEvaluator:
         """
         numeric_cols = [col for col in metrics_df.columns if col in self.metrics]
         
-        summary = metrics_df.groupby('Model')[numeric_cols].agg([
-            'mean', 'std', 'min', 'max', 'median'
-        ]).round(4)
+        # um único groupby reaproveitado; cada estatística é uma redução Cython direta
+        grouped = metrics_df.groupby('Model', observed=True)[numeric_cols]
+        stats = ['mean', 'std', 'min', 'max', 'median']
+        summary = pd.concat([getattr(grouped, stat)() for stat in stats], axis=1, keys=stats)
+        summary = summary.swaplevel(axis=1)[pd.MultiIndex.from_product([numeric_cols, stats])]
         
-        return summary
\ No newline at end of file
+        return summary.round(4)
\ No newline at end of file
@@ -9,12 +9,12 @@ class DynamicSelection(ABC):
         self.history_errors = {model: [] for model in base_models}
 
     def _extract_lag_windows(self, series):
-        """Cria janelas de lags e targets a partir de uma série univariada."""
-        windows, targets = [], []
-        for i in range(self.windows_size, len(series)):
-            windows.append(series[i-self.windows_size:i])
-            targets.append(series[i])
-        return np.array(windows), np.array(targets)
+        """Cria janelas de lags e targets a partir de uma série univariada (views, sem cópia)."""
+        series = np.asarray(series)
+        if len(series) <= self.windows_size:
+            return np.empty((0, self.windows_size), dtype=series.dtype), series[self.windows_size:]
+        windows = np.lib.stride_tricks.sliding_window_view(series[:-1], self.windows_size)
+        return windows, series[self.windows_size:]
 
     def fit(self, X, y):
         """Treina cada modelo base uma vez no conjunto global."""
@@ -22,10 +22,13 @@ class DynamicSelection(ABC):
             model.fit(X, y)
 
     def update_history(self, y_true, preds_dict):
-        """Atualiza erros históricos para cada modelo base."""
+        """Atualiza erros históricos para cada modelo base (aceita escalares ou arrays de passos)."""
         for model, y_pred in preds_dict.items():
-            error = abs(y_true - y_pred)
-            self.history_errors[model].append(error)
+            error = np.abs(np.subtract(y_true, y_pred))
+            if error.ndim:
+                self.history_errors[model].extend(error)
+            else:
+                self.history_errors[model].append(error)
 
     @abstractmethod
     def predict(self, y_series, horizon=1):
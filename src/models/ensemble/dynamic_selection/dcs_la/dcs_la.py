@@ -1,8 +1,9 @@
 from src.models.ensemble.dynamic_selection.base_dynamic_selection import DynamicSelection
 
+import logging
 import numpy as np
-from sklearn.metrics.pairwise import euclidean_distances, cosine_similarity
-from sklearn.metrics import mean_squared_error, mean_absolute_error
+
+logger = logging.getLogger(__name__)
 
 class DCSLARegressor(DynamicSelection):
     def __init__(self, base_models, top_k, windows_size=12, similarity="cosine"):
@@ -23,13 +24,10 @@ class DCSLARegressor(DynamicSelection):
         self.similarity = similarity
 
     def _evaluate_models(self, X, y):
-        """Treina cada modelo nos dados de competência e retorna os erros (MAE)."""
-        errors = []
-        for model in self.base_models:
-            y_pred = model.predict(X)
-            mae = mean_absolute_error(y, y_pred)
-            errors.append(mae)
-        return np.array(errors)
+        """Avalia nos dados de competência os modelos já treinados em fit (sem re-treino) e retorna os erros (MAE)."""
+        # previsões empilhadas (n_modelos, n_amostras): MAE de todos em uma única redução
+        preds = np.stack([np.ravel(model.predict(X)) for model in self.base_models])
+        return np.abs(preds - y).mean(axis=1)
 
     def predict(self, y_series, horizon): # type: ignore
         """
@@ -50,40 +48,60 @@ class DCSLARegressor(DynamicSelection):
         if len(y_series) < self.windows_size + horizon:
             raise ValueError(f"Série temporal muito curta. Necessário pelo menos {self.windows_size + horizon} pontos, mas recebido {len(y_series)}")
         
-        y_train = y_series[:-horizon]
+        # o histórico observado é sempre o prefixo y_series[:end]: as janelas são
+        # extraídas uma única vez e cada passo só avança 'end'
+        end = len(y_series) - horizon
         y_real_future = y_series[-horizon:]
-        curr_lags = y_train[-self.windows_size:]
-        forecast = []
+        windows_all, targets_all = self._extract_lag_windows(y_series)
+        # normas pré-calculadas: cada passo vira um único produto matriz-vetor (BLAS gemv)
+        windows_f = np.ascontiguousarray(windows_all, dtype=np.float64)
+        if self.similarity == "cosine":
+            norms = np.linalg.norm(windows_f, axis=1)
+            norms[norms == 0] = 1.0  # janela nula tem similaridade 0, como no sklearn
+            windows_unit = windows_f / norms[:, None]
+        else:
+            windows_sqsum = np.einsum('ij,ij->i', windows_f, windows_f)
+        forecast = np.empty(horizon, dtype=np.float64)
+        chosen = np.empty(horizon, dtype=np.intp)
 
         for step in range(horizon):
-            windows, targets = self._extract_lag_windows(y_train)
+            curr_lags = y_series[end - self.windows_size:end]
+            windows = windows_all[:end - self.windows_size]
+            targets = targets_all[:end - self.windows_size]
 
-            # calcular similaridade/distância
+            # calcular similaridade/distância; seleção top-k em O(N), sem ordenar tudo
+            top_k = min(self.top_k, len(windows))
+            n_windows = len(windows)
+            query = curr_lags.astype(np.float64, copy=False)
             if self.similarity == "cosine":
-                sims = cosine_similarity([curr_lags], windows)[0] # type: ignore
-                top_k_idx = sims.argsort()[-self.top_k:]
+                query_norm = np.linalg.norm(query)
+                sims = windows_unit[:n_windows] @ (query / query_norm if query_norm else query)
+                top_k_idx = np.argpartition(sims, -top_k)[-top_k:]
             else:  # euclidean
-                dists = euclidean_distances([curr_lags], windows)[0] # type: ignore
-                top_k_idx = dists.argsort()[:self.top_k]
+                # ||w||² - 2·w·q: mesma ordem da distância (||q||² e a raiz não mudam o ranking)
+                dists = windows_sqsum[:n_windows] - 2.0 * (windows_f[:n_windows] @ query)
+                top_k_idx = np.argpartition(dists, top_k - 1)[:top_k]
 
             competence_X = windows[top_k_idx]
             competence_y = targets[top_k_idx]
 
             # pegar melhor modelo
             errors = self._evaluate_models(competence_X, competence_y)
-            best_model = self.base_models[np.argmin(errors)]
-            print(best_model)
+            chosen[step] = np.argmin(errors)
+            best_model = self.base_models[chosen[step]]
+            # formatação lazy: o repr do estimador só é montado com DEBUG habilitado
+            logger.debug("passo %d: modelo escolhido %s", step, best_model)
 
-            # prever próximo passo e atualizar histórico de erros
-            y_next = best_model.predict([curr_lags])[0]
-            self.update_history(
-                y_real_future[step],
-                {best_model: y_next}
-            )
-            forecast.append(y_next)
+            # o valor real do passo entra no histórico
+            end += 1
 
-            # atualizar histórico da série
-            curr_lags = np.append(curr_lags[1:], y_real_future[step])
-            y_train = np.append(y_train, y_real_future[step])
+        # os lags de cada passo só usam valores reais, então as previsões não dependem umas
+        # das outras: um único predict por modelo escolhido, com os lags de todos os seus passos
+        step_lags = windows_all[len(y_series) - horizon - self.windows_size:][:horizon]
+        for idx, model in enumerate(self.base_models):
+            steps = chosen == idx
+            if steps.any():
+                forecast[steps] = np.ravel(model.predict(step_lags[steps]))
+                self.update_history(y_real_future[steps], {model: forecast[steps]})
 
-        return np.array(forecast), y_real_future
\ No newline at end of file
+        return forecast, y_real_future
\ No newline at end of file
@@ -1,8 +1,10 @@
 from src.models.ensemble.dynamic_selection.base_dynamic_selection import DynamicSelection
 
+import logging
 import numpy as np
 from sklearn.metrics.pairwise import euclidean_distances, cosine_similarity
-from sklearn.metrics import mean_squared_error, mean_absolute_error
+
+logger = logging.getLogger(__name__)
 
 class DSNAW(DynamicSelection):
     def __init__(self, base_models, last_k, windows_size=12):
@@ -20,13 +22,10 @@ class DSNAW(DynamicSelection):
         self.last_k = last_k
 
     def _evaluate_models(self, X, y):
-        """Treina cada modelo nos dados de competência e retorna os erros (MAE)."""
-        errors = []
-        for model in self.base_models:
-            y_pred = model.predict(X)
-            mae = mean_absolute_error(y, y_pred)
-            errors.append(mae)
-        return np.array(errors)
+        """Avalia nos dados de competência os modelos já treinados em fit (sem re-treino) e retorna os erros (MAE)."""
+        # previsões empilhadas (n_modelos, n_amostras): MAE de todos em uma única redução
+        preds = np.stack([np.ravel(model.predict(X)) for model in self.base_models])
+        return np.abs(preds - y).mean(axis=1)
 
     def predict(self, y_series, horizon): # type: ignore
         """
@@ -47,32 +46,38 @@ class DSNAW(DynamicSelection):
         if len(y_series) < self.windows_size + horizon:
             raise ValueError(f"Série temporal muito curta. Necessário pelo menos {self.windows_size + horizon} pontos, mas recebido {len(y_series)}")
         
-        y_train = y_series[:-horizon]
+        # o histórico observado é sempre o prefixo y_series[:end]: as janelas são
+        # extraídas uma única vez e cada passo só avança 'end'
+        end = len(y_series) - horizon
         y_real_future = y_series[-horizon:]
-        curr_lags = y_train[-self.windows_size:]
-        forecast = []
+        windows_all, targets_all = self._extract_lag_windows(y_series)
+        forecast = np.empty(horizon, dtype=np.float64)
+        chosen = np.empty(horizon, dtype=np.intp)
 
         for step in range(horizon):
-            windows, targets = self._extract_lag_windows(y_train)
+            windows = windows_all[:end - self.windows_size]
+            targets = targets_all[:end - self.windows_size]
 
             competence_X = windows[:-self.last_k]
             competence_y = targets[:-self.last_k]
 
             # pegar melhor modelo
             errors = self._evaluate_models(competence_X, competence_y)
-            best_model = self.base_models[np.argmin(errors)]
-            print(best_model)
+            chosen[step] = np.argmin(errors)
+            best_model = self.base_models[chosen[step]]
+            # formatação lazy: o repr do estimador só é montado com DEBUG habilitado
+            logger.debug("passo %d: modelo escolhido %s", step, best_model)
 
-            # prever próximo passo e atualizar histórico de erros
-            y_next = best_model.predict([curr_lags])[0]
-            self.update_history(
-                y_real_future[step],
-                {best_model: y_next}
-            )
-            forecast.append(y_next)
+            # o valor real do passo entra no histórico
+            end += 1
 
-            # atualizar histórico da série
-            curr_lags = np.append(curr_lags[1:], y_real_future[step])
-            y_train = np.append(y_train, y_real_future[step])
+        # os lags de cada passo só usam valores reais, então as previsões não dependem umas
+        # das outras: um único predict por modelo escolhido, com os lags de todos os seus passos
+        step_lags = windows_all[len(y_series) - horizon - self.windows_size:][:horizon]
+        for idx, model in enumerate(self.base_models):
+            steps = chosen == idx
+            if steps.any():
+                forecast[steps] = np.ravel(model.predict(step_lags[steps]))
+                self.update_history(y_real_future[steps], {model: forecast[steps]})
 
-        return np.array(forecast), y_real_future
\ No newline at end of file
+        return forecast, y_real_future
\ No newline at end of file
@@ -1,14 +1,19 @@
 import os
+from functools import lru_cache
 
+@lru_cache(maxsize=1)
 def get_project_root() -> str:
     """
     Encontra o root do projeto procurando pelo setup.py.
     
+    O resultado é memorizado: o disco só é percorrido na primeira chamada.
+    
     Returns:
         Caminho absoluto para o root do projeto
     """
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    while current_dir != '/':
+    # dirname da raiz devolve ela mesma ('/' ou 'C:\\'), o que encerra a busca em qualquer SO
+    while os.path.dirname(current_dir) != current_dir:
         if os.path.exists(os.path.join(current_dir, 'setup.py')):
             return current_dir
         current_dir = os.path.dirname(current_dir)
@@ -1,30 +1,32 @@
+import numpy as np
 import pandas as pd
 
 def split_series(df):
-    train_list = []
-    test_list = []
-    val_list = []
+    # posição de cada linha dentro da sua série, calculada de uma vez para o frame inteiro
+    groups = df.groupby('unique_id', observed=True)
+    group_id = groups.ngroup().to_numpy(dtype=np.int64, na_value=-1)
+    sizes = groups.size()
 
-    for uid, group in df.groupby('unique_id'):
-        n = len(group)
-        
-        train_end = int(n * 0.7)
-        test_start = train_end
-        
-        val_start = int(train_end * 0.8)
-        
-        train = group.iloc[:val_start].copy()
-        val = group.iloc[val_start:train_end].copy()
-        test = group.iloc[test_start:].copy()
-        print(f"Treino + Val {uid}: {len(train) + len(val)} | Teste {uid}: {len(test)}")
-        
-        train_list.append(train)
-        val_list.append(val)
-        test_list.append(test)
+    # mesma ordem do laço por grupo: séries ordenadas por unique_id, linhas na ordem original
+    if (group_id < 0).any() or (np.diff(group_id) < 0).any():
+        order = np.argsort(group_id, kind='stable')
+        order = order[group_id[order] >= 0]
+        df = df.iloc[order]
+        group_id = group_id[order]
 
-    df_train = pd.concat(train_list).reset_index(drop=True)
-    df_val = pd.concat(val_list).reset_index(drop=True)
-    df_test = pd.concat(test_list).reset_index(drop=True)
+    counts = sizes.to_numpy()
+    train_end = (counts * 0.7).astype(np.int64)
+    val_start = (train_end * 0.8).astype(np.int64)
+    for uid, n, end in zip(sizes.index, counts, train_end):
+        print(f"Treino + Val {uid}: {end} | Teste {uid}: {n - end}")
+
+    pos = np.arange(len(group_id)) - (np.cumsum(counts) - counts)[group_id]
+    row_train_end = train_end[group_id]
+    row_val_start = val_start[group_id]
+
+    df_train = df[pos < row_val_start].reset_index(drop=True)
+    df_val = df[(pos >= row_val_start) & (pos < row_train_end)].reset_index(drop=True)
+    df_test = df[pos >= row_train_end].reset_index(drop=True)
     print(f'Splitted data into TRAIN with size {len(df_train)}, VALIDATION with size {len(df_val)} and TEST with size {len(df_test)}')
 
-    return df_train, df_val, df_test
\ No newline at end of file
+    return df_train, df_val, df_test
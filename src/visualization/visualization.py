@@ -1,6 +1,10 @@
+import inspect
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import seaborn as sns
 from typing import List, Dict, Optional, Union, Callable
 import numpy as np
@@ -60,9 +64,6 @@ class ForecastVisualizer:
         # Criar diretório se necessário
         if self.save_plots:
             self.output_dir.mkdir(exist_ok=True)
-        
-        # Registrar plots padrão
-        self._register_default_plots()
     
     def _get_default_plots(self) -> List[str]:
         """Retorna lista de plots padrão"""
@@ -74,16 +75,17 @@ class ForecastVisualizer:
             'residuals_analysis'
         ]
     
-    def _register_default_plots(self):
-        """Registra plots padrão"""
-        PlotRegistry.register_plot('metrics_comparison', self._plot_metrics_comparison)
-        PlotRegistry.register_plot('forecasts_grid', self._plot_forecasts_grid)
-        PlotRegistry.register_plot('validation_forecasts', self._plot_validation_forecasts)
-        PlotRegistry.register_plot('test_forecasts', self._plot_test_forecasts)
-        PlotRegistry.register_plot('residuals_analysis', self._plot_residuals_analysis)
+    @classmethod
+    def _register_default_plots(cls):
+        """Registra plots padrão (uma única vez, na importação do módulo)"""
+        PlotRegistry.register_plot('metrics_comparison', cls._plot_metrics_comparison)
+        PlotRegistry.register_plot('forecasts_grid', cls._plot_forecasts_grid)
+        PlotRegistry.register_plot('validation_forecasts', cls._plot_validation_forecasts)
+        PlotRegistry.register_plot('test_forecasts', cls._plot_test_forecasts)
+        PlotRegistry.register_plot('residuals_analysis', cls._plot_residuals_analysis)
     
+    @staticmethod
     def _plot_metrics_comparison(
-    self, 
     metrics_df: pd.DataFrame, 
     metrics: Optional[List[str]] = None,
     **kwargs
@@ -124,8 +126,8 @@ class ForecastVisualizer:
         plt.tight_layout()
         return fig
     
+    @staticmethod
     def _plot_forecasts_grid(
-    self,
     actual: pd.DataFrame,
     forecasts: pd.DataFrame,
     models: List[str],
@@ -143,29 +145,39 @@ class ForecastVisualizer:
         else:
             axes_flat = axes.flatten()
         
+        # Particiona uma única vez em vez de uma máscara booleana por commodity
+        actual_by = {cid: g for cid, g in actual.groupby('unique_id', sort=False, observed=True)}
+        forecasts_by = {cid: g for cid, g in forecasts.groupby('unique_id', sort=False, observed=True)}
+        
+        # Cor fixa por modelo, seguindo o ciclo de cores do estilo ativo
+        color_cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        plotted_models = [m for m in models if m in forecasts.columns]
+        model_colors = {m: color_cycle[i % len(color_cycle)] for i, m in enumerate(plotted_models)}
+        
         for idx, commodity in enumerate(commodities):
             ax = axes_flat[idx]
             
             # Plot valores reais
-            actual_data = actual[actual['unique_id'] == commodity]
-            ax.plot(
+            actual_data = actual_by.get(commodity, actual.iloc[0:0])
+            actual_line, = ax.plot(
                 actual_data['ds'],
                 actual_data['y'],
                 label='Valor Real',
                 color='black',
-                linewidth=2
+                linewidth=2,
+                rasterized=True
             )
             
-            # Plot previsões
-            forecast_data = forecasts[forecasts['unique_id'] == commodity]
-            for model in models:
-                if model in forecast_data.columns:
-                    ax.plot(
-                        forecast_data['ds'],
-                        forecast_data[model],
-                        label=model,
-                        alpha=0.8
-                    )
+            # Plot previsões: todas as linhas dos modelos em um único artist
+            forecast_data = forecasts_by.get(commodity, forecasts.iloc[0:0])
+            x = ForecastVisualizer._to_plot_x(forecast_data['ds'])
+            ax.add_collection(LineCollection(
+                [np.column_stack([x, forecast_data[m].to_numpy(dtype=float)]) for m in plotted_models],
+                colors=[model_colors[m] for m in plotted_models],
+                alpha=0.8,
+                rasterized=True
+            ))
+            ax.autoscale_view()
             
             ax.set_title(commodity)
             ax.grid(True, alpha=0.3)
@@ -177,26 +189,37 @@ class ForecastVisualizer:
         
         plt.tight_layout()
         
-        # Pegar handles e labels do último axes que foi usado
+        # Legenda: linha real + proxies dos modelos (a LineCollection não tem label por linha)
         if commodities:
-            handles, labels = axes_flat[len(commodities)-1].get_legend_handles_labels()
-            fig.legend(handles, labels, loc='lower center', ncol=len(models)+1)
+            handles = [actual_line] + [
+                Line2D([], [], color=model_colors[m], alpha=0.8, label=m) for m in plotted_models
+            ]
+            fig.legend(handles, [h.get_label() for h in handles], loc='lower center', ncol=len(models)+1)
         
         return fig
     
+    # Duplicada em scripts/visualization.py (scripts/ não importa de src/); mantenha as duas iguais
+    @staticmethod
+    def _to_plot_x(ds: pd.Series) -> np.ndarray:
+        """Converte o eixo x para os números que o matplotlib usa internamente."""
+        if pd.api.types.is_datetime64_any_dtype(ds):
+            return mdates.date2num(ds.to_numpy())
+        return ds.to_numpy(dtype=float)
+    
+    @staticmethod
     def _plot_validation_forecasts(
-        self,
         train_data: pd.DataFrame,
         val_data: pd.DataFrame,
         forecasts_val: pd.DataFrame,
         commodity: str,
         models: Optional[List[str]] = None,
+        figsize: tuple = (12, 6),
         **kwargs
     ) -> Figure:
         """Plota previsões de validação vs valores reais"""
         models = models or ['Naive', 'AutoARIMA']
         
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = plt.subplots(figsize=figsize)
         
         # Dados de treino
         train_commodity = train_data[train_data['unique_id'] == commodity]
@@ -206,7 +229,8 @@ class ForecastVisualizer:
             label=f'Real {commodity} (Treino)',
             linestyle='--',
             color='gray',
-            alpha=0.7
+            alpha=0.7,
+            rasterized=True
         )
         
         # Dados de validação
@@ -217,7 +241,8 @@ class ForecastVisualizer:
             label=f'Real {commodity} (Validação)',
             linestyle='-',
             color='black',
-            linewidth=2
+            linewidth=2,
+            rasterized=True
         )
         
         # Previsões
@@ -228,7 +253,8 @@ class ForecastVisualizer:
                     forecast_commodity['ds'],
                     forecast_commodity[model],
                     label=f'Previsão {model}',
-                    alpha=0.8
+                    alpha=0.8,
+                    rasterized=True
                 )
         
         ax.legend()
@@ -239,19 +265,20 @@ class ForecastVisualizer:
         plt.tight_layout()
         return fig
     
+    @staticmethod
     def _plot_test_forecasts(
-        self,
         full_train: pd.DataFrame,
         test_data: pd.DataFrame,
         forecasts_test: pd.DataFrame,
         commodity: str,
         models: Optional[List[str]] = None,
+        figsize: tuple = (12, 6),
         **kwargs
     ) -> Figure:
         """Plota previsões de teste vs valores reais"""
         models = models or ['Naive', 'AutoARIMA']
         
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = plt.subplots(figsize=figsize)
         
         # Dados de treino + validação
         train_commodity = full_train[full_train['unique_id'] == commodity]
@@ -261,7 +288,8 @@ class ForecastVisualizer:
             label=f'Real {commodity} (Treino + Validação)',
             linestyle='--',
             color='gray',
-            alpha=0.7
+            alpha=0.7,
+            rasterized=True
         )
         
         # Dados de teste
@@ -272,7 +300,8 @@ class ForecastVisualizer:
             label=f'Real {commodity} (Teste)',
             linestyle='-',
             color='black',
-            linewidth=2
+            linewidth=2,
+            rasterized=True
         )
         
         # Previsões
@@ -283,7 +312,8 @@ class ForecastVisualizer:
                     forecast_commodity['ds'],
                     forecast_commodity[model],
                     label=f'Previsão {model}',
-                    alpha=0.8
+                    alpha=0.8,
+                    rasterized=True
                 )
         
         ax.legend()
@@ -294,8 +324,8 @@ class ForecastVisualizer:
         plt.tight_layout()
         return fig
     
+    @staticmethod
     def _plot_residuals_analysis(
-        self,
         actual: pd.DataFrame,
         forecasts: pd.DataFrame,
         model: str,
@@ -355,6 +385,9 @@ class ForecastVisualizer:
             raise ValueError(f"Plot '{plot_type}' não está na lista de plots configurados")
         
         plot_func = PlotRegistry.get_plot(plot_type)
+        # plots registrados não dependem da instância: o tamanho padrão vai como argumento
+        if 'figsize' in inspect.signature(plot_func).parameters:
+            kwargs.setdefault('figsize', self.figsize)
         fig = plot_func(**kwargs)
         
         if self.save_plots:
@@ -393,4 +426,8 @@ class ForecastVisualizer:
         """Adiciona um novo tipo de plot"""
         PlotRegistry.register_plot(name, plot_func)
         if name not in self.plot_types:
-            self.plot_types.append(name)
\ No newline at end of file
+            self.plot_types.append(name)
+
+
+# Registro feito uma única vez por processo, não a cada ForecastVisualizer criado
+ForecastVisualizer._register_default_plots()
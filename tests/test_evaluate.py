@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    mean_absolute_error,
+    mean_absolute_percentage_error,
+    mean_squared_error,
+    root_mean_squared_error,
+    r2_score
+)
+
+from scripts import evaluate
+from scripts.evaluate import evaluate_forecasts
+
+SKLEARN_METRICS = {
+    'MAE': mean_absolute_error,
+    'MAPE': mean_absolute_percentage_error,
+    'MSE': mean_squared_error,
+    'RMSE': root_mean_squared_error,
+    'R2': r2_score
+}
+
+PATHS = ['numpy', pytest.param('numba', marks=pytest.mark.skipif(
+    evaluate.numba is None, reason='numba não instalado'))]
+
+
+@pytest.fixture(params=PATHS)
+def path(request, monkeypatch):
+    """Força o caminho NumPy ou o kernel numba independente do tamanho da série."""
+    min_size = 0 if request.param == 'numba' else np.inf
+    monkeypatch.setattr(evaluate, 'NUMBA_MIN_SIZE', min_size)
+    return request.param
+
+
+def _cases():
+    rng = np.random.default_rng(0)
+    y = rng.normal(100, 10, size=1000)
+    ones = np.ones(1000)
+    return {
+        'ordinaria': (y, y + rng.normal(0, 2, size=1000)),
+        'constante_perfeita': (ones, ones.copy()),
+        'constante_com_erro': (ones, ones + 1),
+    }
+
+
+@pytest.mark.parametrize('case', list(_cases()))
+def test_evaluate_forecasts_matches_sklearn(path, case):
+    y_true, y_pred = _cases()[case]
+    result = evaluate_forecasts(y_true, y_pred)
+    for name, metric in SKLEARN_METRICS.items():
+        assert result[name] == pytest.approx(metric(y_true, y_pred), rel=1e-9), name
+
+
+def test_evaluate_forecasts_single_point_r2_is_nan(path):
+    assert np.isnan(evaluate_forecasts([1.0], [2.0])['R2'])
+
+
+def test_evaluate_forecasts_empty_raises():
+    with pytest.raises(ValueError):
+        evaluate_forecasts([], [])
+
+
+def test_evaluate_forecasts_large_constant_series():
+    # acima de NUMBA_MIN_SIZE: o kernel devolve floats Python, sem divisão por SST nulo
+    ones = np.ones(200_000)
+    assert evaluate_forecasts(ones, ones)['R2'] == 1.0
+    assert evaluate_forecasts(ones, ones + 1)['R2'] == 0.0
@@ -0,0 +1,57 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import _fastparse
+from src.data import preprocessors
+from src.data.preprocessors import FloatConverter
+
+MALFORMED = ['1.234,56', '12a', '-', '1,5,0']
+
+
+@pytest.fixture(params=['numba', 'arrow'])
+def converter_path(request, monkeypatch):
+    """Roda o FloatConverter pelo kernel numba ou pelo fallback Arrow/pandas."""
+    if request.param == 'numba' and not _fastparse.NUMBA_AVAILABLE:
+        pytest.skip('numba não instalado')
+    monkeypatch.setattr(preprocessors, 'NUMBA_AVAILABLE', request.param == 'numba')
+    return request.param
+
+
+def test_valid_prices_parse_without_warning(converter_path):
+    # expoente fica fora do kernel e cai no float(), como na conversão original
+    df = pd.DataFrame({'y': ['18,24', ' 5,98 ', '-0,5', '7', '3.25', '1e3', '2,5E-1']})
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        out = FloatConverter('y').transform(df)
+    np.testing.assert_allclose(out['y'], [18.24, 5.98, -0.5, 7.0, 3.25, 1000.0, 0.25], rtol=1e-6)
+
+
+def test_missing_prices_become_nan_silently(converter_path):
+    df = pd.DataFrame({'y': ['1,5', '', '   ', None]})
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        out = FloatConverter('y').transform(df)
+    assert out['y'].iloc[0] == pytest.approx(1.5)
+    assert out['y'].iloc[1:].isna().all()
+
+
+@pytest.mark.parametrize('value', MALFORMED)
+def test_malformed_price_becomes_nan_with_warning(converter_path, value):
+    df = pd.DataFrame({'y': ['1,5', value]})
+    with pytest.warns(UserWarning, match='não numérico'):
+        out = FloatConverter('y').transform(df)
+    assert out['y'].iloc[0] == pytest.approx(1.5)
+    assert np.isnan(out['y'].iloc[1])
+
+
+def test_import_does_not_compile_kernel():
+    if not _fastparse.NUMBA_AVAILABLE:
+        pytest.skip('numba não instalado')
+    import subprocess, sys
+    code = ('import src.data.preprocessors, src.data._fastparse as f; '
+            'print(len(f._parse_decimal_comma.signatures))')
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == '0'
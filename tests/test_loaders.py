@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.loaders import CommodityLoader
+from src.data.preprocessors import ParquetExporter
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Cache isolado por teste, fora de data/cache."""
+    monkeypatch.setattr(CommodityLoader, 'CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+# ACUCAR_SANTOS começa em 2020-01: com esse limite a série fica vazia
+EMPTY_LIMIT = '01/01/2020'
+
+
+@pytest.mark.parametrize('monthly_aggregation', ['mean', 'first', 'last', None])
+def test_load_commodity_empty_series_keeps_categorical(cache_dir, monthly_aggregation):
+    for _ in ('frio', 'cache'):
+        df = CommodityLoader.load_commodity(
+            'acucar_santos', monthly_aggregation=monthly_aggregation, limit_date=EMPTY_LIMIT
+        )
+        assert df.empty
+        assert df['unique_id'].dtype == CommodityLoader.UNIQUE_ID_DTYPE
+
+
+@pytest.mark.parametrize('monthly_aggregation', ['mean', 'first', 'last', None])
+def test_load_commodity_y_is_float32(cache_dir, monthly_aggregation):
+    # o caminho frio grava o cache e o quente lê o Parquet: ambos devem manter float32
+    for _ in ('frio', 'cache'):
+        df = CommodityLoader.load_commodity('milho', monthly_aggregation=monthly_aggregation)
+        assert not df.empty
+        assert df['y'].dtype == np.float32
+        assert any(cache_dir.iterdir())
+
+
+@pytest.mark.parametrize('limit_date', [EMPTY_LIMIT, '15/01/2020'])
+def test_load_all_commodities_unique_id_dtype_with_empty_series(cache_dir, limit_date):
+    for _ in ('frio', 'cache'):
+        df = CommodityLoader.load_all_commodities(limit_date=limit_date)
+        assert df['unique_id'].dtype == CommodityLoader.UNIQUE_ID_DTYPE
+        if limit_date == EMPTY_LIMIT:
+            assert 'ACUCAR_SANTOS' not in set(df['unique_id'])
+        assert df['unique_id'].is_monotonic_increasing
+
+
+def test_load_all_commodities_skips_failing_series(cache_dir, monkeypatch, capsys):
+    # cache de MILHO não gravável: só essa série falha, as demais continuam carregando
+    original_export = ParquetExporter.export.__func__
+
+    def export(cls, df, path_parquet, **write_options):
+        if len(df) and df['unique_id'].iloc[0] == 'MILHO':
+            raise OSError('sem permissão de escrita')
+        return original_export(cls, df, path_parquet, **write_options)
+
+    monkeypatch.setattr(ParquetExporter, 'export', classmethod(export))
+    df = CommodityLoader.load_all_commodities()
+    loaded = set(df['unique_id'])
+    assert 'MILHO' not in loaded
+    assert len(loaded) == len(CommodityLoader.COMMODITY_CONFIGS) - 1
+    assert 'Erro ao carregar milho' in capsys.readouterr().out
+
+
+def test_cache_writes_are_quiet(cache_dir, capsys, tmp_path):
+    CommodityLoader.load_commodity('milho')
+    CommodityLoader.load_all_commodities()
+    assert 'Arquivo salvo em' not in capsys.readouterr().out
+    assert any(cache_dir.iterdir())
+
+    # exportação explícita continua informando o caminho
+    path = str(tmp_path / 'export' / 'milho.parquet')
+    ParquetExporter.export(CommodityLoader.load_commodity('milho'), path)
+    assert f'Arquivo salvo em: {path}' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('monthly_aggregation', ['mean', 'first', 'last', None])
+def test_load_commodity_polars_matches_pandas(monthly_aggregation):
+    pytest.importorskip('polars')
+    config = CommodityLoader.COMMODITY_CONFIGS['milho']
+    absolute_path = CommodityLoader._get_absolute_path(config['data_path'])
+    limit_date = '01/01/2022'
+
+    df_polars = CommodityLoader._load_commodity_polars(
+        config, absolute_path, 'BRL', monthly_aggregation, limit_date
+    )
+    df_pandas = CommodityLoader.load_commodity(
+        'milho', monthly_aggregation=monthly_aggregation, limit_date=limit_date, use_cache=False
+    )
+
+    assert list(df_polars.columns) == ['ds', 'y', 'unique_id']
+    assert df_polars['unique_id'].dtype == CommodityLoader.UNIQUE_ID_DTYPE
+    assert len(df_polars) == len(df_pandas)
+    np.testing.assert_array_equal(
+        df_polars['ds'].to_numpy('datetime64[ns]'), df_pandas['ds'].to_numpy('datetime64[ns]')
+    )
+    np.testing.assert_allclose(
+        df_polars['y'].to_numpy(dtype=float), df_pandas['y'].to_numpy(dtype=float), rtol=1e-6
+    )
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from scripts.time_series_visualization import downsample_lttb
+
+
+def _series(n, tz=None):
+    ds = pd.Series(pd.date_range('2000-01-01', periods=n, freq='D', tz='UTC'))
+    ds = ds.dt.tz_convert(tz) if tz else ds.dt.tz_localize(None)
+    y = pd.Series(np.sin(np.linspace(0, 20, n)) * 10 + 50)
+    return ds, y
+
+
+def test_downsample_lttb_tz_aware_dates():
+    ds, y = _series(5000, tz='America/Sao_Paulo')
+    xs, ys = downsample_lttb(ds, y, n_out=500)
+    assert len(xs) == len(ys) == 500
+    assert xs.dt.tz is not None
+    assert xs.is_monotonic_increasing
+    # mesmos pontos escolhidos que a série equivalente sem fuso
+    naive_xs, _ = downsample_lttb(ds.dt.tz_convert(None), y, n_out=500)
+    np.testing.assert_array_equal(xs.index, naive_xs.index)
+
+
+def test_downsample_lttb_drops_nan():
+    ds, y = _series(5000)
+    y.iloc[::7] = np.nan
+    xs, ys = downsample_lttb(ds, y, n_out=500)
+    assert len(xs) == len(ys) == 500
+    assert not ys.isna().any()
+    assert xs.iloc[0] == ds.iloc[1] and xs.iloc[-1] == ds.iloc[-1]
+
+
+def test_downsample_lttb_nan_leaves_few_points():
+    ds, y = _series(3000)
+    y.iloc[100:] = np.nan
+    xs, ys = downsample_lttb(ds, y, n_out=500)
+    assert len(xs) == 100
+    assert not ys.isna().any()